@@ -0,0 +1,76 @@
+"""unique skill names ignoring case
+
+Revision ID: 2e9a6c0f4b13
+Revises: 8b3d4f6e1a27
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '2e9a6c0f4b13'
+down_revision = '8b3d4f6e1a27'
+branch_labels = None
+depends_on = None
+
+SKILL_MERGES = """
+SELECT skills.id AS duplicate_id, keepers.keeper_id
+FROM skills
+JOIN (
+    SELECT lower(name) AS name_key, MIN(id) AS keeper_id
+    FROM skills
+    GROUP BY lower(name)
+    HAVING COUNT(*) > 1
+) AS keepers ON lower(skills.name) = keepers.name_key
+WHERE skills.id <> keepers.keeper_id
+"""
+
+SKILL_TABLES = ("skills_offered", "skills_wanted")
+SWAP_COLUMNS = ("offered_skill_id", "wanted_skill_id")
+
+MERGE_SQL = [
+    *(
+        f"""
+        INSERT INTO {table} (user_id, skill_id)
+        SELECT DISTINCT {table}.user_id, merges.keeper_id
+        FROM {table} JOIN ({SKILL_MERGES}) AS merges ON {table}.skill_id = merges.duplicate_id
+        WHERE true
+        ON CONFLICT DO NOTHING
+        """
+        for table in SKILL_TABLES
+    ),
+    *(
+        f"""
+        UPDATE swap_requests SET {column} = (
+            SELECT merges.keeper_id FROM ({SKILL_MERGES}) AS merges
+            WHERE merges.duplicate_id = swap_requests.{column}
+        )
+        WHERE {column} IN (SELECT duplicate_id FROM ({SKILL_MERGES}) AS merges)
+        """
+        for column in SWAP_COLUMNS
+    ),
+    f"""
+    UPDATE skills SET is_approved = true
+    WHERE id IN (
+        SELECT merges.keeper_id FROM ({SKILL_MERGES}) AS merges
+        JOIN skills AS duplicates ON duplicates.id = merges.duplicate_id
+        WHERE duplicates.is_approved
+    )
+    """,
+    *(
+        f"DELETE FROM {table} WHERE skill_id IN (SELECT duplicate_id FROM ({SKILL_MERGES}) AS merges)"
+        for table in SKILL_TABLES
+    ),
+    f"DELETE FROM skills WHERE id IN (SELECT duplicate_id FROM ({SKILL_MERGES}) AS merges)",
+]
+
+
+def upgrade() -> None:
+    for statement in MERGE_SQL:
+        op.execute(sa.text(statement))
+    op.create_index("uq_skills_name_lower", "skills", [sa.text("lower(name)")], unique=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("uq_skills_name_lower", table_name="skills")
@@ -0,0 +1,46 @@
+"""user search vector
+
+Revision ID: 4a7f2d9c6e51
+Revises: 2e9a6c0f4b13
+Create Date: 2026-10-17 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '4a7f2d9c6e51'
+down_revision = '2e9a6c0f4b13'
+branch_labels = None
+depends_on = None
+
+USER_SEARCH_VECTOR_SQL = """
+UPDATE users SET search_vector =
+    setweight(to_tsvector('simple', coalesce(users.name, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce((
+        SELECT string_agg(skills.name, ' ')
+        FROM skills_offered JOIN skills ON skills.id = skills_offered.skill_id
+        WHERE skills_offered.user_id = users.id
+    ), '')), 'B') ||
+    setweight(to_tsvector('simple', coalesce(users.bio, '')), 'C')
+"""
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("ALTER TABLE users ADD COLUMN IF NOT EXISTS search_vector tsvector")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_users_search_vector ON users USING gin (search_vector)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_users_name_trgm ON users USING gin (name gin_trgm_ops)")
+    op.execute(sa.text(USER_SEARCH_VECTOR_SQL))
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.drop_index("idx_users_name_trgm", table_name="users")
+    op.drop_index("idx_users_search_vector", table_name="users")
+    op.drop_column("users", "search_vector")
@@ -0,0 +1,33 @@
+"""default user flags
+
+Revision ID: 5c1e7a2b9d40
+Revises: 
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '5c1e7a2b9d40'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+USER_FLAGS = {
+    "is_public": sa.true(),
+    "is_banned": sa.false(),
+    "is_admin": sa.false(),
+}
+
+
+def upgrade() -> None:
+    users = sa.table("users", *(sa.column(name, sa.Boolean) for name in USER_FLAGS))
+    for name, default in USER_FLAGS.items():
+        op.execute(users.update().where(users.c[name].is_(None)).values({name: default}))
+        op.alter_column("users", name, server_default=default)
+
+
+def downgrade() -> None:
+    for name in USER_FLAGS:
+        op.alter_column("users", name, server_default=None)
@@ -0,0 +1,30 @@
+"""swap request bucket indexes
+
+Revision ID: 6d0b8e3a9f72
+Revises: 4a7f2d9c6e51
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '6d0b8e3a9f72'
+down_revision = '4a7f2d9c6e51'
+branch_labels = None
+depends_on = None
+
+SWAP_INDEXES = {
+    "idx_swap_requests_requester_status_created": ["requester_id", "status", "created_at"],
+    "idx_swap_requests_responder_status_created": ["responder_id", "status", "created_at"],
+}
+
+
+def upgrade() -> None:
+    for name, columns in SWAP_INDEXES.items():
+        op.create_index(name, "swap_requests", columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name in SWAP_INDEXES:
+        op.drop_index(name, table_name="swap_requests")
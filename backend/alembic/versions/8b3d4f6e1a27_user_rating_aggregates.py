@@ -0,0 +1,64 @@
+"""user rating aggregates
+
+Revision ID: 8b3d4f6e1a27
+Revises: 5c1e7a2b9d40
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '8b3d4f6e1a27'
+down_revision = '5c1e7a2b9d40'
+branch_labels = None
+depends_on = None
+
+RATING_COLUMNS = ["rating_count", "rating_sum"] + [f"rating_{stars}" for stars in range(1, 6)]
+
+BACKFILL_SQL = """
+UPDATE users SET
+    rating_count = totals.rating_count,
+    rating_sum = totals.rating_sum,
+    rating_1 = totals.rating_1,
+    rating_2 = totals.rating_2,
+    rating_3 = totals.rating_3,
+    rating_4 = totals.rating_4,
+    rating_5 = totals.rating_5
+FROM (
+    SELECT
+        rated_id,
+        COUNT(*) AS rating_count,
+        SUM(stars) AS rating_sum,
+        COUNT(CASE WHEN stars = 1 THEN 1 END) AS rating_1,
+        COUNT(CASE WHEN stars = 2 THEN 1 END) AS rating_2,
+        COUNT(CASE WHEN stars = 3 THEN 1 END) AS rating_3,
+        COUNT(CASE WHEN stars = 4 THEN 1 END) AS rating_4,
+        COUNT(CASE WHEN stars = 5 THEN 1 END) AS rating_5
+    FROM ratings
+    GROUP BY rated_id
+) AS totals
+WHERE users.id = totals.rated_id
+"""
+
+
+def upgrade() -> None:
+    existing_columns, existing_indexes = set(), set()
+    if not op.get_context().as_sql:
+        inspector = sa.inspect(op.get_bind())
+        existing_columns = {column["name"] for column in inspector.get_columns("users")}
+        existing_indexes = {index["name"] for index in inspector.get_indexes("users")}
+
+    for name in RATING_COLUMNS:
+        if name not in existing_columns:
+            op.add_column("users", sa.Column(name, sa.Integer(), nullable=False, server_default="0"))
+    if "idx_users_rating_count" not in existing_indexes:
+        op.create_index("idx_users_rating_count", "users", ["rating_count"])
+
+    op.execute(sa.text(BACKFILL_SQL))
+
+
+def downgrade() -> None:
+    op.drop_index("idx_users_rating_count", table_name="users")
+    for name in reversed(RATING_COLUMNS):
+        op.drop_column("users", name)
@@ -1,30 +1,111 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Response
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql import Select
+from typing import Optional
 import csv
 import io
 from datetime import datetime
-from ..database import get_db
-from ..models import User, Skill, SwapRequest, Rating
-from ..schemas import UserProfile, Skill as SkillSchema, SwapRequestResponse
-from ..core import get_current_admin_user
+from ..database import get_db, get_sessionmaker, engine, pool_metrics
+from ..models import User, Skill, SwapRequest, SwapStatus, skills_offered
+from ..schemas import AdminUser, AdminSwap, AdminUserPage, AdminSkillPage, AdminSwapPage, Skill as SkillSchema
+from ..core import get_current_admin_user, invalidate_cached_user, match_index, skill_catalogue, skill_suggester
+from ..utils import encode_cursor, decode_cursor
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
-@router.get("/users", response_model=List[UserProfile])
+CSV_BATCH_SIZE = 1000
+ADMIN_PAGE_SIZE = 50
+ADMIN_MAX_PAGE_SIZE = 500
+
+def offered_skill_count():
+    return select(func.count()).where(
+        skills_offered.c.user_id == User.id
+    ).correlate(User).scalar_subquery()
+
+def swap_rows_query() -> Select:
+    requester = aliased(User)
+    responder = aliased(User)
+    offered_skill = aliased(Skill)
+    wanted_skill = aliased(Skill)
+    return select(
+        SwapRequest.id,
+        SwapRequest.requester_id,
+        requester.name.label("requester_name"),
+        SwapRequest.responder_id,
+        responder.name.label("responder_name"),
+        offered_skill.name.label("offered_skill"),
+        wanted_skill.name.label("wanted_skill"),
+        SwapRequest.status,
+        SwapRequest.created_at
+    ).join(
+        requester, SwapRequest.requester_id == requester.id
+    ).join(
+        responder, SwapRequest.responder_id == responder.id
+    ).join(
+        offered_skill, SwapRequest.offered_skill_id == offered_skill.id
+    ).join(
+        wanted_skill, SwapRequest.wanted_skill_id == wanted_skill.id
+    )
+
+def filter_created(query: Select, created_column, created_after: Optional[datetime], created_before: Optional[datetime]) -> Select:
+    if created_after:
+        query = query.where(created_column >= created_after)
+    if created_before:
+        query = query.where(created_column < created_before)
+    return query
+
+async def fetch_page(db: AsyncSession, query: Select, id_column, cursor: Optional[str], limit: int):
+    if cursor:
+        (last_id,) = decode_cursor(cursor, int)
+        query = query.where(id_column > last_id)
+    result = await db.execute(query.order_by(id_column).limit(limit + 1))
+    rows = result.all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].id)
+    return rows, next_cursor
+
+@router.get("/users", response_model=AdminUserPage)
 async def get_all_users(
+    banned: Optional[bool] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(ADMIN_PAGE_SIZE, ge=1, le=ADMIN_MAX_PAGE_SIZE),
     current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    users = db.query(User).all()
-    return users
+    query = select(
+        User.id,
+        User.name,
+        User.email,
+        User.avatar_url,
+        func.coalesce(User.is_public, True).label("is_public"),
+        func.coalesce(User.is_banned, False).label("is_banned"),
+        func.coalesce(User.is_admin, False).label("is_admin"),
+        func.coalesce(User.availability, "available").label("availability"),
+        User.created_at,
+        offered_skill_count().label("offered_skill_count")
+    )
+    if banned is not None:
+        query = query.where(func.coalesce(User.is_banned, False) == banned)
+    query = filter_created(query, User.created_at, created_after, created_before)
+    
+    rows, next_cursor = await fetch_page(db, query, User.id, cursor, limit)
+    return AdminUserPage(
+        items=[AdminUser(**row._mapping) for row in rows],
+        next_cursor=next_cursor
+    )
 
 @router.put("/users/{user_id}/ban")
 async def ban_user(
     user_id: int,
     current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     if user_id == current_user.id:
         raise HTTPException(
@@ -32,7 +113,7 @@ async def ban_user(
             detail="Cannot ban yourself"
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -40,7 +121,9 @@ async def ban_user(
         )
     
     user.is_banned = True
-    db.commit()
+    await db.commit()
+    invalidate_cached_user(user.id)
+    match_index.update_user(user.id, searchable=False)
     
     return {"message": f"User {user.name} has been banned"}
 
@@ -48,9 +131,9 @@ async def ban_user(
 async def unban_user(
     user_id: int,
     current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -58,25 +141,40 @@ async def unban_user(
         )
     
     user.is_banned = False
-    db.commit()
+    await db.commit()
+    invalidate_cached_user(user.id)
+    match_index.update_user(user.id, searchable=bool(user.is_public))
     
     return {"message": f"User {user.name} has been unbanned"}
 
-@router.get("/skills", response_model=List[SkillSchema])
+@router.get("/skills", response_model=AdminSkillPage)
 async def get_all_skills_admin(
+    approved: Optional[bool] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(ADMIN_PAGE_SIZE, ge=1, le=ADMIN_MAX_PAGE_SIZE),
     current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    skills = db.query(Skill).all()
-    return skills
+    query = select(Skill.id, Skill.name, Skill.description, Skill.is_approved, Skill.created_at)
+    if approved is not None:
+        query = query.where(Skill.is_approved == approved)
+    query = filter_created(query, Skill.created_at, created_after, created_before)
+    
+    rows, next_cursor = await fetch_page(db, query, Skill.id, cursor, limit)
+    return AdminSkillPage(
+        items=[SkillSchema(**row._mapping) for row in rows],
+        next_cursor=next_cursor
+    )
 
 @router.put("/skills/{skill_id}/approve")
 async def approve_skill(
     skill_id: int,
     current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    skill = db.query(Skill).filter(Skill.id == skill_id).first()
+    skill = await db.get(Skill, skill_id)
     if not skill:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -84,7 +182,9 @@ async def approve_skill(
         )
     
     skill.is_approved = True
-    db.commit()
+    await db.commit()
+    skill_catalogue.invalidate()
+    skill_suggester.add(skill.id, skill.name, skill.description)
     
     return {"message": f"Skill {skill.name} has been approved"}
 
@@ -92,9 +192,9 @@ async def approve_skill(
 async def reject_skill(
     skill_id: int,
     current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    skill = db.query(Skill).filter(Skill.id == skill_id).first()
+    skill = await db.get(Skill, skill_id)
     if not skill:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -102,70 +202,72 @@ async def reject_skill(
         )
     
     skill.is_approved = False
-    db.commit()
+    await db.commit()
+    skill_catalogue.invalidate()
+    skill_suggester.remove(skill.id)
     
     return {"message": f"Skill {skill.name} has been rejected"}
 
-@router.get("/swaps")
+@router.get("/swaps", response_model=AdminSwapPage)
 async def get_all_swaps_admin(
+    swap_status: Optional[SwapStatus] = Query(None, alias="status"),
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(ADMIN_PAGE_SIZE, ge=1, le=ADMIN_MAX_PAGE_SIZE),
     current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    swaps = db.query(SwapRequest).all()
+    query = swap_rows_query()
+    if swap_status:
+        query = query.where(SwapRequest.status == swap_status)
+    query = filter_created(query, SwapRequest.created_at, created_after, created_before)
     
-    return [
-        {
-            "id": swap.id,
-            "requester_name": swap.requester.name,
-            "responder_name": swap.responder.name,
-            "offered_skill": swap.offered_skill.name,
-            "wanted_skill": swap.wanted_skill.name,
-            "status": swap.status.value,
-            "created_at": swap.created_at
-        }
-        for swap in swaps
-    ]
+    rows, next_cursor = await fetch_page(db, query, SwapRequest.id, cursor, limit)
+    return AdminSwapPage(
+        items=[AdminSwap(**row._mapping) for row in rows],
+        next_cursor=next_cursor
+    )
+
+@router.get("/db/pool")
+async def get_pool_metrics(current_user: User = Depends(get_current_admin_user)):
+    return pool_metrics(engine)
 
 @router.get("/stats/csv")
 async def export_stats_csv(
     current_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    session_factory: async_sessionmaker = Depends(get_sessionmaker)
 ):
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    writer.writerow([
-        "Type", "ID", "Name", "Email", "Created_At", "Status", "Additional_Info"
-    ])
-    
-    users = db.query(User).all()
-    for user in users:
-        writer.writerow([
-            "User",
-            user.id,
-            user.name,
-            user.email,
-            user.created_at,
-            "Banned" if user.is_banned else "Active",
-            f"Skills: {len(user.offered_skills)}"
-        ])
-    
-    swaps = db.query(SwapRequest).all()
-    for swap in swaps:
-        writer.writerow([
-            "Swap",
-            swap.id,
-            f"{swap.requester.name} -> {swap.responder.name}",
-            "",
-            swap.created_at,
-            swap.status.value,
-            f"{swap.offered_skill.name} for {swap.wanted_skill.name}"
-        ])
-    
-    output.seek(0)
-    
     return StreamingResponse(
-        io.BytesIO(output.getvalue().encode()),
+        stream_stats_csv(session_factory),
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename=skillswap_stats_{datetime.now().strftime('%Y%m%d')}.csv"}
-    )
\ No newline at end of file
+    )
+
+async def stream_stats_csv(session_factory: async_sessionmaker):
+    yield csv_chunk([["Type", "ID", "Name", "Email", "Created_At", "Status", "Additional_Info"]])
+    
+    users = select(
+        User.id, User.name, User.email, User.created_at, User.is_banned, offered_skill_count()
+    ).order_by(User.id)
+    swaps = swap_rows_query().order_by(SwapRequest.id)
+    
+    async with session_factory() as db:
+        result = await db.stream(users.execution_options(yield_per=CSV_BATCH_SIZE))
+        async for rows in result.partitions():
+            yield csv_chunk([
+                ["User", user_id, name, email, created_at, "Banned" if is_banned else "Active", f"Skills: {skill_count}"]
+                for user_id, name, email, created_at, is_banned, skill_count in rows
+            ])
+        
+        result = await db.stream(swaps.execution_options(yield_per=CSV_BATCH_SIZE))
+        async for rows in result.partitions():
+            yield csv_chunk([
+                ["Swap", swap.id, f"{swap.requester_name} -> {swap.responder_name}", "", swap.created_at, swap.status.value, f"{swap.offered_skill} for {swap.wanted_skill}"]
+                for swap in rows
+            ])
+
+def csv_chunk(rows) -> bytes:
+    output = io.StringIO()
+    csv.writer(output).writerows(rows)
+    return output.getvalue().encode()
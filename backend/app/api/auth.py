@@ -1,17 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Cookie
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 from ..database import get_db
 from ..models import User
 from ..schemas import UserRegister, UserLogin, Token, RefreshToken
-from ..core import verify_password, get_password_hash, create_access_token, create_refresh_token, verify_token, create_csrf_token
+from ..core import verify_password_async, get_password_hash_async, create_access_token, create_refresh_token, verify_token, create_csrf_token
 from ..config import settings
+from ..utils import get_user_search_backend
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 @router.post("/register", response_model=dict)
-async def register(user_data: UserRegister, response: Response, db: Session = Depends(get_db)):
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+async def register(user_data: UserRegister, response: Response, db: AsyncSession = Depends(get_db)):
+    password_hash = await get_password_hash_async(user_data.password)
+    
+    existing_user = await db.scalar(select(User.id).where(User.email == user_data.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -23,13 +27,15 @@ async def register(user_data: UserRegister, response: Response, db: Session = De
     user = User(
         name=user_data.name,
         email=user_data.email,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=password_hash,
         is_admin=is_admin
     )
     
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.flush()
+    await get_user_search_backend(db).refresh_vectors(db, [user.id])
+    await db.commit()
+    await db.refresh(user)
     
     access_token = create_access_token(data={"sub": str(user.id)})
     refresh_token = create_refresh_token(data={"sub": str(user.id)})
@@ -63,10 +69,14 @@ async def register(user_data: UserRegister, response: Response, db: Session = De
     return {"message": "User registered successfully", "user_id": user.id}
 
 @router.post("/login", response_model=dict)
-async def login(user_data: UserLogin, response: Response, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == user_data.email).first()
+async def login(user_data: UserLogin, response: Response, db: AsyncSession = Depends(get_db)):
+    result = await db.execute(
+        select(User.id, User.password_hash, User.is_banned).where(User.email == user_data.email)
+    )
+    user = result.one_or_none()
+    await db.rollback()
     
-    if not user or not verify_password(user_data.password, user.password_hash):
+    if not user or not await verify_password_async(user_data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
@@ -113,7 +123,7 @@ async def login(user_data: UserLogin, response: Response, db: Session = Depends(
 async def refresh_token(
     response: Response,
     refresh_token: str = Cookie(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     if not refresh_token:
         raise HTTPException(
@@ -129,7 +139,7 @@ async def refresh_token(
         )
     
     user_id = payload.get("sub")
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    user = await db.get(User, int(user_id))
     
     if not user or user.is_banned:
         raise HTTPException(
@@ -0,0 +1,70 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from typing import List
+from ..database import get_db, get_sessionmaker
+from ..models import User
+from ..schemas import SwapMatch, SwapCycle, SwapCycleStep, UserSearch
+from ..core import get_current_active_user, match_index, find_swap_cycles
+from ..utils import user_skill_options
+
+router = APIRouter(prefix="/matches", tags=["matches"])
+
+@router.get("/", response_model=List[SwapMatch])
+async def get_my_matches(
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker = Depends(get_sessionmaker)
+):
+    await match_index.ensure_loaded(session_factory)
+    matches = match_index.matches(current_user.id, limit)
+    if not matches:
+        return []
+    
+    result = await db.execute(
+        select(User).where(User.id.in_([match.user_id for match in matches])).options(*user_skill_options())
+    )
+    users = {user.id: user for user in result.scalars()}
+    
+    return [
+        SwapMatch(
+            user=UserSearch.model_validate(users[match.user_id]),
+            offered_skill_ids=sorted(match.offered_skill_ids),
+            wanted_skill_ids=sorted(match.wanted_skill_ids),
+            overlap=match.overlap
+        )
+        for match in matches
+        if match.user_id in users
+    ]
+
+@router.get("/cycles", response_model=List[SwapCycle])
+async def get_my_swap_cycles(
+    max_length: int = Query(4, ge=2, le=4),
+    limit: int = Query(20, ge=1, le=50),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker = Depends(get_sessionmaker)
+):
+    await match_index.ensure_loaded(session_factory)
+    cycles = [cycle for cycle in find_swap_cycles(current_user.id) if len(cycle.user_ids) <= max_length][:limit]
+    if not cycles:
+        return []
+    
+    user_ids = {user_id for cycle in cycles for user_id in cycle.user_ids}
+    result = await db.execute(select(User).where(User.id.in_(user_ids)).options(*user_skill_options()))
+    users = {user.id: UserSearch.model_validate(user) for user in result.scalars()}
+    
+    return [
+        SwapCycle(
+            users=[users[user_id] for user_id in cycle.user_ids],
+            steps=[
+                SwapCycleStep(teacher_id=teacher_id, learner_id=learner_id, skill_ids=sorted(skill_ids))
+                for teacher_id, learner_id, skill_ids in zip(
+                    cycle.user_ids, cycle.user_ids[1:] + cycle.user_ids[:1], cycle.skill_ids
+                )
+            ]
+        )
+        for cycle in cycles
+        if all(user_id in users for user_id in cycle.user_ids)
+    ]
@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from typing import List
 from ..database import get_db
 from ..models import Rating, SwapRequest, SwapStatus, User
 from ..schemas import RatingCreate, RatingResponse
-from ..core import get_current_active_user
+from ..core import get_current_active_user, invalidate_cached_user, match_index, emit_event, prebuilt_response
 
 router = APIRouter(prefix="/ratings", tags=["ratings"])
 
@@ -12,9 +14,9 @@ router = APIRouter(prefix="/ratings", tags=["ratings"])
 async def create_rating(
     rating_data: RatingCreate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    swap_request = db.query(SwapRequest).filter(SwapRequest.id == rating_data.swap_id).first()
+    swap_request = await db.get(SwapRequest, rating_data.swap_id)
     
     if not swap_request:
         raise HTTPException(
@@ -34,7 +36,7 @@ async def create_rating(
             detail="Not authorized to rate this swap"
         )
     
-    rated_user = db.query(User).filter(User.id == rating_data.rated_id).first()
+    rated_user = await db.get(User, rating_data.rated_id)
     if not rated_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -53,10 +55,12 @@ async def create_rating(
             detail="Cannot rate yourself"
         )
     
-    existing_rating = db.query(Rating).filter(
-        Rating.swap_id == rating_data.swap_id,
-        Rating.rater_id == current_user.id
-    ).first()
+    existing_rating = await db.scalar(
+        select(Rating).where(
+            Rating.swap_id == rating_data.swap_id,
+            Rating.rater_id == current_user.id
+        )
+    )
     
     if existing_rating:
         raise HTTPException(
@@ -76,37 +80,56 @@ async def create_rating(
     
     swap_request.status = SwapStatus.COMPLETED
     
-    db.commit()
-    db.refresh(rating)
+    star_column = getattr(User, f"rating_{rating_data.stars}")
+    await db.execute(
+        update(User).where(User.id == rating_data.rated_id).values({
+            User.rating_count: User.rating_count + 1,
+            User.rating_sum: User.rating_sum + rating_data.stars,
+            star_column: star_column + 1
+        })
+    )
+    
+    await db.commit()
+    invalidate_cached_user(rating_data.rated_id)
+    match_index.update_user(rated_user.id, average_rating=rated_user.average_rating)
+    await db.refresh(rating)
     
-    return RatingResponse(
+    response = RatingResponse(
         id=rating.id,
         swap_id=rating.swap_id,
         rater_id=rating.rater_id,
         rated_id=rating.rated_id,
-        rater_name=rating.rater.name,
-        rated_name=rating.rated.name,
+        rater_name=current_user.name,
+        rated_name=rated_user.name,
         stars=rating.stars,
         comment=rating.comment,
         created_at=rating.created_at
     )
+    emit_event(response.rated_id, "rating_received", response.model_dump(mode="json"))
+    return response
 
 @router.get("/user/{user_id}", response_model=List[RatingResponse])
 async def get_user_ratings(
     user_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    ratings = db.query(Rating).filter(Rating.rated_id == user_id).all()
+    result = await db.execute(
+        select(Rating).where(Rating.rated_id == user_id).options(
+            joinedload(Rating.rater),
+            joinedload(Rating.rated)
+        )
+    )
+    ratings = result.scalars().all()
     
-    return [
+    return prebuilt_response([
         RatingResponse(
             id=rating.id,
             swap_id=rating.swap_id,
@@ -119,4 +142,4 @@ async def get_user_ratings(
             created_at=rating.created_at
         )
         for rating in ratings
-    ]
\ No newline at end of file
+    ])
\ No newline at end of file
@@ -1,88 +1,195 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, text
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response
+from sqlalchemy import select, func, text, or_, and_
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Tuple
 from ..database import get_db
 from ..models import Skill, User
-from ..schemas import SkillBase, SkillCreate, SkillSearchResult
-from ..core import get_current_active_user, get_optional_current_user
+from ..schemas import SkillBase, SkillCreate, SkillBulkCreate, SkillBulkCreateResult, SkillSearchResult
+from ..core import get_current_active_user, get_optional_current_user, skill_catalogue, etag_matches, skill_suggester
+from ..utils import encode_cursor, decode_cursor
 
 router = APIRouter(prefix="/skills", tags=["skills"])
 
+SIMILARITY_THRESHOLD = 0.1
+SEARCH_COUNT_CAP = 1000
+
 @router.get("/search", response_model=SkillSearchResult)
 async def search_skills(
     q: Optional[str] = Query(None, min_length=1),
     page: int = Query(1, ge=1),
     per_page: int = Query(10, ge=1, le=50),
+    cursor: Optional[str] = None,
+    count: str = Query("exact", pattern="^(exact|capped|none)$"),
     current_user: Optional[User] = Depends(get_optional_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    query = db.query(Skill).filter(Skill.is_approved == True)
+    if q and db.get_bind().dialect.name == "postgresql":
+        # The % operator is what lets Postgres use idx_skills_name_trgm; its
+        # cut-off is a setting, so scope ours to this transaction.
+        await db.execute(
+            text("SELECT set_config('pg_trgm.similarity_threshold', :threshold, true)"),
+            {"threshold": str(SIMILARITY_THRESHOLD)}
+        )
+    query, sort_key = skill_search_query(q)
     
-    if q:
-        similarity_threshold = 0.1
-        query = query.filter(
-            text("similarity(skills.name, :search_term) > :threshold")
-        ).params(search_term=q, threshold=similarity_threshold).order_by(
-            text("similarity(skills.name, :search_term) DESC")
-        ).params(search_term=q)
-    else:
-        query = query.order_by(Skill.name)
+    total = None
+    total_capped = False
+    if count == "exact":
+        total = await db.scalar(select(func.count()).select_from(query.subquery()))
+    elif count == "capped":
+        capped = query.limit(SEARCH_COUNT_CAP + 1).subquery()
+        total = await db.scalar(select(func.count()).select_from(capped))
+        total_capped = total > SEARCH_COUNT_CAP
+        total = min(total, SEARCH_COUNT_CAP)
     
-    total = query.count()
-    offset = (page - 1) * per_page
-    skills = query.offset(offset).limit(per_page).all()
+    query = skill_search_page(query, sort_key, q, cursor, page, per_page)
+    result = await db.execute(query)
+    rows = result.all()
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
     
-    has_more = offset + len(skills) < total
+    next_cursor = None
+    if has_more:
+        last_skill, last_key = rows[-1]
+        next_cursor = encode_cursor(last_key, last_skill.id)
     
     return SkillSearchResult(
-        skills=skills,
+        skills=[skill for skill, _ in rows],
         total=total,
+        total_capped=total_capped,
         page=page,
         per_page=per_page,
-        has_more=has_more
+        has_more=has_more,
+        next_cursor=next_cursor
     )
 
+def skill_search_query(q: Optional[str]) -> Tuple[Select, ColumnElement]:
+    query = select(Skill).where(Skill.is_approved == True)
+    if q:
+        return query.where(Skill.name.op("%")(q)), func.similarity(Skill.name, q)
+    return query, Skill.name
+
+def skill_search_page(
+    query: Select,
+    sort_key: ColumnElement,
+    q: Optional[str],
+    cursor: Optional[str],
+    page: int,
+    per_page: int
+) -> Select:
+    query = query.add_columns(sort_key)
+    if q:
+        query = query.order_by(sort_key.desc(), Skill.id)
+    else:
+        query = query.order_by(sort_key, Skill.id)
+    
+    if cursor:
+        last_key, last_id = decode_cursor(cursor, float if q else str, int)
+        if q:
+            after = or_(sort_key < last_key, and_(sort_key == last_key, Skill.id > last_id))
+        else:
+            after = or_(sort_key > last_key, and_(sort_key == last_key, Skill.id > last_id))
+        query = query.where(after)
+    else:
+        query = query.offset((page - 1) * per_page)
+    return query.limit(per_page + 1)
+
 @router.post("/", response_model=SkillBase)
 async def create_skill(
     skill_data: SkillCreate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    existing_skill = db.query(Skill).filter(
-        func.lower(Skill.name) == func.lower(skill_data.name)
-    ).first()
-    
-    if existing_skill:
-        return existing_skill
+    created, existing = await upsert_skills(db, [skill_data])
+    await db.commit()
+    publish_created_skills(created)
+    if not created and not existing:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Skill conflicts with an existing skill"
+        )
+    return (created or existing)[0]
+
+@router.post("/bulk", response_model=SkillBulkCreateResult)
+async def bulk_create_skills(
+    bulk_data: SkillBulkCreate,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    created, existing = await upsert_skills(db, bulk_data.skills)
+    await db.commit()
+    publish_created_skills(created)
+    return SkillBulkCreateResult(created=created, existing=existing)
+
+async def upsert_skills(db: AsyncSession, skills: List[SkillCreate]):
+    requested = {}
+    for skill in skills:
+        requested.setdefault(skill.name.lower(), skill)
     
-    skill = Skill(
-        name=skill_data.name,
-        description=skill_data.description,
-        is_approved=True
+    insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    result = await db.execute(
+        insert(Skill).values([
+            {"name": skill.name, "description": skill.description, "is_approved": True}
+            for skill in requested.values()
+        ]).on_conflict_do_nothing().returning(Skill.id, Skill.name, Skill.description)
     )
+    created = [SkillBase(**row._mapping) for row in result]
     
-    db.add(skill)
-    db.commit()
-    db.refresh(skill)
+    created_keys = {skill.name.lower() for skill in created}
+    missing = [skill.name for key, skill in requested.items() if key not in created_keys]
+    existing = []
+    if missing:
+        result = await db.execute(
+            select(Skill.id, Skill.name, Skill.description).where(or_(
+                Skill.name.in_(missing),
+                func.lower(Skill.name).in_([func.lower(name) for name in missing])
+            ))
+        )
+        existing = [SkillBase(**row._mapping) for row in result]
     
-    return skill
+    order = {name: position for position, name in enumerate(requested)}
+    created.sort(key=lambda skill: order.get(skill.name.lower(), len(order)))
+    existing.sort(key=lambda skill: order.get(skill.name.lower(), len(order)))
+    return created, existing
+
+def publish_created_skills(created: List[SkillBase]):
+    if not created:
+        return
+    skill_catalogue.invalidate()
+    for skill in created:
+        skill_suggester.add(skill.id, skill.name, skill.description)
+
+@router.get("/suggest", response_model=List[SkillBase])
+async def suggest_skills(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=25),
+    db: AsyncSession = Depends(get_db)
+):
+    await skill_suggester.ensure_loaded(db)
+    return [SkillBase(**skill._asdict()) for skill in skill_suggester.suggest(q, limit)]
 
 @router.get("/", response_model=List[SkillBase])
 async def get_all_skills(
+    if_none_match: Optional[str] = Header(None),
     current_user: Optional[User] = Depends(get_optional_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    skills = db.query(Skill).filter(Skill.is_approved == True).order_by(Skill.name).all()
-    return skills
+    catalogue = await skill_catalogue.get(db)
+    headers = {"ETag": catalogue.etag, "Cache-Control": "no-cache"}
+    if etag_matches(catalogue.etag, if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=catalogue.body, media_type="application/json", headers=headers)
 
 @router.get("/{skill_id}", response_model=SkillBase)
 async def get_skill(
     skill_id: int,
     current_user: Optional[User] = Depends(get_optional_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    skill = db.query(Skill).filter(Skill.id == skill_id).first()
+    skill = await db.get(Skill, skill_id)
     if not skill:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,18 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import select, func, or_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import List, Optional
+from datetime import datetime
 from ..database import get_db
-from ..models import SwapRequest, SwapStatus, User, Skill, Rating
+from ..models import SwapRequest, SwapStatus, User, Skill
 from ..schemas import SwapRequestCreate, SwapRequestUpdate, SwapRequestResponse, MySwapsResponse
-from ..core import get_current_active_user
+from ..core import get_current_active_user, emit_event, prebuilt_response
+from ..utils import encode_cursor, decode_cursor
 
 router = APIRouter(prefix="/swaps", tags=["swaps"])
 
+SWAP_BUCKETS = {
+    "pending": [SwapStatus.PENDING],
+    "accepted": [SwapStatus.ACCEPTED],
+    "completed": [SwapStatus.COMPLETED],
+    "history": [SwapStatus.REJECTED, SwapStatus.CANCELLED]
+}
+
 @router.post("/", response_model=SwapRequestResponse)
 async def create_swap_request(
     swap_data: SwapRequestCreate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     if swap_data.responder_id == current_user.id:
         raise HTTPException(
@@ -20,15 +31,15 @@ async def create_swap_request(
             detail="Cannot create swap request with yourself"
         )
     
-    responder = db.query(User).filter(User.id == swap_data.responder_id).first()
+    responder = await db.get(User, swap_data.responder_id)
     if not responder:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Responder not found"
         )
     
-    offered_skill = db.query(Skill).filter(Skill.id == swap_data.offered_skill_id).first()
-    wanted_skill = db.query(Skill).filter(Skill.id == swap_data.wanted_skill_id).first()
+    offered_skill = await db.get(Skill, swap_data.offered_skill_id)
+    wanted_skill = await db.get(Skill, swap_data.wanted_skill_id)
     
     if not offered_skill or not wanted_skill:
         raise HTTPException(
@@ -36,6 +47,9 @@ async def create_swap_request(
             detail="Skill not found"
         )
     
+    await db.refresh(current_user, ["offered_skills"])
+    await db.refresh(responder, ["offered_skills"])
+    
     if offered_skill not in current_user.offered_skills:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -48,13 +62,15 @@ async def create_swap_request(
             detail="Responder doesn't offer the wanted skill"
         )
     
-    existing_request = db.query(SwapRequest).filter(
-        SwapRequest.requester_id == current_user.id,
-        SwapRequest.responder_id == swap_data.responder_id,
-        SwapRequest.offered_skill_id == swap_data.offered_skill_id,
-        SwapRequest.wanted_skill_id == swap_data.wanted_skill_id,
-        SwapRequest.status == SwapStatus.PENDING
-    ).first()
+    existing_request = await db.scalar(
+        select(SwapRequest).where(
+            SwapRequest.requester_id == current_user.id,
+            SwapRequest.responder_id == swap_data.responder_id,
+            SwapRequest.offered_skill_id == swap_data.offered_skill_id,
+            SwapRequest.wanted_skill_id == swap_data.wanted_skill_id,
+            SwapRequest.status == SwapStatus.PENDING
+        )
+    )
     
     if existing_request:
         raise HTTPException(
@@ -71,19 +87,21 @@ async def create_swap_request(
     )
     
     db.add(swap_request)
-    db.commit()
-    db.refresh(swap_request)
+    await db.commit()
     
-    return build_swap_response(swap_request, db)
+    swap_request = await get_swap_with_relations(swap_request.id, db)
+    response = build_swap_response(swap_request)
+    emit_event(response.responder_id, "new_request", response.model_dump(mode="json"))
+    return response
 
 @router.put("/{swap_id}", response_model=SwapRequestResponse)
 async def update_swap_request(
     swap_id: int,
     swap_update: SwapRequestUpdate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    swap_request = db.query(SwapRequest).filter(SwapRequest.id == swap_id).first()
+    swap_request = await get_swap_with_relations(swap_id, db)
     
     if not swap_request:
         raise HTTPException(
@@ -116,58 +134,78 @@ async def update_swap_request(
         )
     
     swap_request.status = swap_update.status
-    db.commit()
-    db.refresh(swap_request)
+    await db.commit()
     
-    return build_swap_response(swap_request, db)
+    response = build_swap_response(swap_request)
+    other_party_id = response.responder_id if current_user.id == response.requester_id else response.requester_id
+    emit_event(other_party_id, "swap_update", response.model_dump(mode="json"), key=response.id)
+    return response
 
 @router.get("/my", response_model=MySwapsResponse)
 async def get_my_swaps(
+    bucket: Optional[str] = Query(None, alias="status", pattern="^(pending|accepted|completed|history)$"),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    swaps = db.query(SwapRequest).filter(
-        (SwapRequest.requester_id == current_user.id) | 
-        (SwapRequest.responder_id == current_user.id)
-    ).options(
-        joinedload(SwapRequest.requester),
-        joinedload(SwapRequest.responder),
-        joinedload(SwapRequest.offered_skill),
-        joinedload(SwapRequest.wanted_skill),
-        joinedload(SwapRequest.rating)
-    ).order_by(SwapRequest.created_at.desc()).all()
+    if cursor and not bucket:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="A status filter is required when paginating with a cursor"
+        )
+    
+    participant = or_(
+        SwapRequest.requester_id == current_user.id,
+        SwapRequest.responder_id == current_user.id
+    )
     
-    pending = []
-    accepted = []
-    completed = []
-    history = []
+    buckets = {name: [] for name in SWAP_BUCKETS}
+    next_cursors = {}
     
-    for swap in swaps:
-        swap_response = build_swap_response(swap, db)
+    for name in ([bucket] if bucket else SWAP_BUCKETS):
+        query = select(SwapRequest).where(
+            participant,
+            SwapRequest.status.in_(SWAP_BUCKETS[name])
+        ).options(
+            *swap_response_options()
+        ).order_by(SwapRequest.created_at.desc(), SwapRequest.id.desc())
+        
+        if cursor:
+            created_at, swap_id = decode_cursor(cursor, datetime.fromisoformat, int)
+            query = query.where(
+                tuple_(SwapRequest.created_at, SwapRequest.id) < tuple_(created_at, swap_id)
+            )
         
-        if swap.status == SwapStatus.PENDING:
-            pending.append(swap_response)
-        elif swap.status == SwapStatus.ACCEPTED:
-            accepted.append(swap_response)
-        elif swap.status == SwapStatus.COMPLETED:
-            completed.append(swap_response)
-        else:
-            history.append(swap_response)
-    
-    return MySwapsResponse(
-        pending=pending,
-        accepted=accepted,
-        completed=completed,
-        history=history
+        result = await db.execute(query.limit(limit + 1))
+        swaps = result.scalars().all()
+        page = swaps[:limit]
+        
+        buckets[name] = [build_swap_response(swap) for swap in page]
+        next_cursors[name] = encode_cursor(page[-1].created_at.isoformat(), page[-1].id) if len(swaps) > limit else None
+    
+    result = await db.execute(
+        select(SwapRequest.status, func.count()).where(participant).group_by(SwapRequest.status)
     )
+    status_counts = dict(result.all())
+    counts = {
+        name: sum(status_counts.get(swap_status, 0) for swap_status in statuses)
+        for name, statuses in SWAP_BUCKETS.items()
+    }
+    
+    return prebuilt_response(MySwapsResponse(
+        **buckets,
+        counts=counts,
+        next_cursors=next_cursors
+    ))
 
 @router.delete("/{swap_id}")
 async def delete_swap_request(
     swap_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    swap_request = db.query(SwapRequest).filter(SwapRequest.id == swap_id).first()
+    swap_request = await db.get(SwapRequest, swap_id)
     
     if not swap_request:
         raise HTTPException(
@@ -187,14 +225,27 @@ async def delete_swap_request(
             detail="Can only delete pending swap requests"
         )
     
-    db.delete(swap_request)
-    db.commit()
+    await db.delete(swap_request)
+    await db.commit()
+    emit_event(swap_request.responder_id, "swap_update", {"id": swap_id, "status": "deleted"}, key=swap_id)
     
     return {"message": "Swap request deleted"}
 
-def build_swap_response(swap_request: SwapRequest, db: Session) -> SwapRequestResponse:
-    rating = db.query(Rating).filter(Rating.swap_id == swap_request.id).first()
-    
+def swap_response_options():
+    return (
+        joinedload(SwapRequest.requester),
+        joinedload(SwapRequest.responder),
+        joinedload(SwapRequest.offered_skill),
+        joinedload(SwapRequest.wanted_skill),
+        joinedload(SwapRequest.rating)
+    )
+
+async def get_swap_with_relations(swap_id: int, db: AsyncSession) -> Optional[SwapRequest]:
+    return await db.scalar(
+        select(SwapRequest).where(SwapRequest.id == swap_id).options(*swap_response_options())
+    )
+
+def build_swap_response(swap_request: SwapRequest) -> SwapRequestResponse:
     return SwapRequestResponse(
         id=swap_request.id,
         requester_id=swap_request.requester_id,
@@ -206,5 +257,5 @@ def build_swap_response(swap_request: SwapRequest, db: Session) -> SwapRequestRe
         status=swap_request.status,
         message=swap_request.message,
         created_at=swap_request.created_at,
-        has_rating=rating is not None
+        has_rating=swap_request.rating is not None
     )
\ No newline at end of file
@@ -1,27 +1,41 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, func
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 import os
 import uuid
 from ..database import get_db
 from ..models import User, Skill, skills_offered, skills_wanted
 from ..schemas import UserProfile, UserPublic, UserUpdate, UserSearch
-from ..core import get_current_active_user, get_optional_current_user
+from ..core import get_current_active_user, get_optional_current_user, invalidate_cached_user, match_index, cycle_cache, prebuilt_response
 from ..config import settings
+from ..utils import get_user_search_backend, user_skill_options, find_missing_skill_ids, replace_user_skills
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 @router.get("/me", response_model=UserProfile)
-async def get_my_profile(current_user: User = Depends(get_current_active_user)):
+async def get_my_profile(
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    await db.refresh(current_user, ["offered_skills", "wanted_skills"])
     return current_user
 
 @router.put("/me", response_model=UserProfile)
 async def update_my_profile(
     user_update: UserUpdate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
+    missing_skill_ids = await find_missing_skill_ids(
+        db, (user_update.offered_skill_ids or []) + (user_update.wanted_skill_ids or [])
+    )
+    if missing_skill_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid skill ids: {', '.join(map(str, missing_skill_ids))}"
+        )
+    
     if user_update.name is not None:
         current_user.name = user_update.name
     if user_update.bio is not None:
@@ -32,28 +46,25 @@ async def update_my_profile(
         current_user.availability = user_update.availability
     
     if user_update.offered_skill_ids is not None:
-        current_user.offered_skills.clear()
-        for skill_id in user_update.offered_skill_ids:
-            skill = db.query(Skill).filter(Skill.id == skill_id).first()
-            if skill:
-                current_user.offered_skills.append(skill)
+        await replace_user_skills(db, skills_offered, current_user.id, user_update.offered_skill_ids)
     
     if user_update.wanted_skill_ids is not None:
-        current_user.wanted_skills.clear()
-        for skill_id in user_update.wanted_skill_ids:
-            skill = db.query(Skill).filter(Skill.id == skill_id).first()
-            if skill:
-                current_user.wanted_skills.append(skill)
-    
-    db.commit()
-    db.refresh(current_user)
+        await replace_user_skills(db, skills_wanted, current_user.id, user_update.wanted_skill_ids)
+    
+    await db.flush()
+    await get_user_search_backend(db).refresh_vectors(db, [current_user.id])
+    await db.commit()
+    invalidate_cached_user(current_user.id)
+    await db.refresh(current_user, ["offered_skills", "wanted_skills"])
+    match_index.index_user(current_user)
+    cycle_cache.invalidate(current_user.id)
     return current_user
 
 @router.post("/me/avatar")
 async def upload_avatar(
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     if file.size > settings.MAX_FILE_SIZE:
         raise HTTPException(
@@ -76,7 +87,8 @@ async def upload_avatar(
         buffer.write(content)
     
     current_user.avatar_url = f"/uploads/{filename}"
-    db.commit()
+    await db.commit()
+    invalidate_cached_user(current_user.id)
     
     return {"avatar_url": current_user.avatar_url}
 
@@ -84,9 +96,12 @@ async def upload_avatar(
 async def get_user_profile(
     user_id: int,
     current_user: Optional[User] = Depends(get_optional_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    user = db.query(User).filter(User.id == user_id).first()
+    result = await db.execute(
+        select(User).where(User.id == user_id).options(*user_skill_options())
+    )
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -106,38 +121,44 @@ async def search_users(
     q: Optional[str] = None,
     availability: Optional[str] = None,
     skill: Optional[str] = None,
+    sort: str = Query("relevance", pattern="^(relevance|rating|rating_count)$"),
     page: int = 1,
     per_page: int = 8,
     current_user: Optional[User] = Depends(get_optional_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    query = db.query(User).filter(
+    query = select(User).where(
         User.is_public == True,
         User.is_banned == False
-    )
+    ).options(*user_skill_options())
     
     if current_user:
-        query = query.filter(User.id != current_user.id)
+        query = query.where(User.id != current_user.id)
+    
+    search_backend = get_user_search_backend(db)
+    rank = None
     
     if q:
-        search_term = f"%{q}%"
-        query = query.filter(
-            or_(
-                User.name.ilike(search_term),
-                User.bio.ilike(search_term)
-            )
-        )
+        query, rank = search_backend.search(query, q)
     
     if availability:
-        query = query.filter(User.availability == availability)
+        query = query.where(User.availability == availability)
     
     if skill:
-        skill_search = f"%{skill}%"
-        query = query.join(User.offered_skills).filter(
-            Skill.name.ilike(skill_search)
-        )
+        query = search_backend.filter_offered_skill(query, skill)
+    
+    if sort == "rating":
+        average_rating = User.rating_sum * 1.0 / func.nullif(User.rating_count, 0)
+        query = query.order_by(func.coalesce(average_rating, 0).desc(), User.rating_count.desc(), User.id)
+    elif sort == "rating_count":
+        query = query.order_by(User.rating_count.desc(), User.id)
+    elif rank is not None:
+        query = query.order_by(rank.desc(), User.id)
+    else:
+        query = query.order_by(User.id)
     
     offset = (page - 1) * per_page
-    users = query.offset(offset).limit(per_page).all()
+    result = await db.execute(query.offset(offset).limit(per_page))
+    users = result.scalars().all()
     
-    return users
\ No newline at end of file
+    return prebuilt_response([UserSearch.model_validate(user) for user in users])
\ No newline at end of file
@@ -1,50 +1,223 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import Dict, List
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from collections import Counter
+from typing import Dict, List, Optional
 import json
 import asyncio
-from ..database import get_db
+import logging
+import time
+from ..config import settings
+from ..database import get_sessionmaker
 from ..models import User
-from ..core import verify_token
+from ..core import verify_token, PubSub, get_pubsub, DomainEvent, event_dispatcher, get_current_admin_user, get_rate_limiter, user_cache, cache_user
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+HEARTBEAT_MESSAGE = json.dumps({"type": "ping"})
+
+class ClientConnection:
+    def __init__(
+        self,
+        websocket: WebSocket,
+        queue_size: int,
+        overflow_policy: str = "close",
+        send_timeout: Optional[float] = None,
+        clock=time.monotonic
+    ):
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.overflow_policy = overflow_policy
+        self.send_timeout = send_timeout
+        self.clock = clock
+        self.last_seen = clock()
+        self.dropped = 0
+        self.sender = asyncio.create_task(self.drain())
+    
+    def send(self, text: str) -> bool:
+        try:
+            self.queue.put_nowait(text)
+        except asyncio.QueueFull:
+            if self.overflow_policy != "drop_oldest":
+                return False
+            self.queue.get_nowait()
+            self.queue.put_nowait(text)
+            self.dropped += 1
+        return True
+    
+    def touch(self):
+        self.last_seen = self.clock()
+    
+    async def drain(self):
+        while True:
+            text = await self.queue.get()
+            try:
+                await asyncio.wait_for(self.websocket.send_text(text), self.send_timeout)
+            except Exception:
+                return
+            if text == HEARTBEAT_MESSAGE:
+                self.touch()
+    
+    def close(self):
+        self.sender.cancel()
+
 class ConnectionManager:
-    def __init__(self):
-        self.active_connections: Dict[int, List[WebSocket]] = {}
+    def __init__(
+        self,
+        bus: PubSub,
+        channel: str = settings.PUBSUB_CHANNEL,
+        queue_size: int = settings.WS_SEND_QUEUE_SIZE,
+        overflow_policy: str = settings.WS_OVERFLOW_POLICY,
+        send_timeout: Optional[float] = settings.WS_SEND_TIMEOUT,
+        heartbeat_interval: float = settings.WS_HEARTBEAT_INTERVAL,
+        idle_timeout: float = settings.WS_IDLE_TIMEOUT,
+        clock=time.monotonic
+    ):
+        self.bus = bus
+        self.channel = channel
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        self.send_timeout = send_timeout
+        self.heartbeat_interval = heartbeat_interval
+        self.idle_timeout = idle_timeout
+        self.clock = clock
+        self.active_connections: Dict[int, List[ClientConnection]] = {}
+        self.closed_connections: Counter = Counter()
+        self.dropped_messages = 0
+        self.listener: Optional[asyncio.Task] = None
+        self.heartbeat: Optional[asyncio.Task] = None
     
     async def connect(self, websocket: WebSocket, user_id: int):
         await websocket.accept()
         if user_id not in self.active_connections:
             self.active_connections[user_id] = []
-        self.active_connections[user_id].append(websocket)
+        connection = ClientConnection(
+            websocket,
+            self.queue_size,
+            overflow_policy=self.overflow_policy,
+            send_timeout=self.send_timeout,
+            clock=self.clock
+        )
+        self.active_connections[user_id].append(connection)
+        self.start()
+        return connection
     
     def disconnect(self, websocket: WebSocket, user_id: int):
         if user_id in self.active_connections:
-            if websocket in self.active_connections[user_id]:
-                self.active_connections[user_id].remove(websocket)
+            for connection in self.active_connections[user_id]:
+                if connection.websocket is websocket:
+                    connection.close()
+                    self.dropped_messages += connection.dropped
+                    self.active_connections[user_id].remove(connection)
+                    break
             if not self.active_connections[user_id]:
                 del self.active_connections[user_id]
     
+    def drop(self, user_id: int, connection: ClientConnection, reason: str, code: int):
+        self.closed_connections[reason] += 1
+        self.disconnect(connection.websocket, user_id)
+        asyncio.create_task(self.close_quietly(connection.websocket, code, reason))
+    
+    def connections(self):
+        return [
+            (user_id, connection)
+            for user_id, connections in self.active_connections.items()
+            for connection in connections
+        ]
+    
     async def send_personal_message(self, message: dict, user_id: int):
-        if user_id in self.active_connections:
-            disconnected = []
-            for connection in self.active_connections[user_id]:
-                try:
-                    await connection.send_text(json.dumps(message))
-                except:
-                    disconnected.append(connection)
-            
-            for connection in disconnected:
-                self.disconnect(connection, user_id)
+        await self.bus.publish(self.channel, f"{user_id}|{json.dumps(message, default=str)}")
     
     async def broadcast_message(self, message: dict):
-        for user_id in list(self.active_connections.keys()):
-            await self.send_personal_message(message, user_id)
+        await self.bus.publish(self.channel, f"*|{json.dumps(message, default=str)}")
+    
+    def deliver(self, envelope: str):
+        target, _, text = envelope.partition("|")
+        if target == "*":
+            recipients = self.connections()
+        else:
+            recipients = [(int(target), connection) for connection in self.active_connections.get(int(target), ())]
+        
+        for user_id, connection in recipients:
+            if not connection.send(text):
+                logger.warning("Dropping slow WebSocket client for user %s", user_id)
+                self.drop(user_id, connection, "slow", 1013)
+    
+    def check_connections(self):
+        now = self.clock()
+        for user_id, connection in self.connections():
+            if connection.sender.done():
+                self.drop(user_id, connection, "dead", 1011)
+            elif now - connection.last_seen > self.idle_timeout:
+                self.drop(user_id, connection, "idle", 1001)
+            elif not connection.send(HEARTBEAT_MESSAGE):
+                self.drop(user_id, connection, "slow", 1013)
+    
+    def metrics(self) -> dict:
+        depths = [connection.queue.qsize() for _, connection in self.connections()]
+        return {
+            "connections": len(depths),
+            "users": len(self.active_connections),
+            "queued_messages": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "dropped_messages": self.dropped_messages + sum(connection.dropped for _, connection in self.connections()),
+            "closed_connections": dict(self.closed_connections)
+        }
+    
+    async def close_quietly(self, websocket: WebSocket, code: int, reason: str):
+        try:
+            await websocket.close(code=code, reason=reason)
+        except Exception:
+            pass
+    
+    def start(self):
+        loop = asyncio.get_running_loop()
+        if self.listener is None or self.listener.done() or self.listener.get_loop() is not loop:
+            self.listener = loop.create_task(self.listen())
+        if self.heartbeat is None or self.heartbeat.done() or self.heartbeat.get_loop() is not loop:
+            self.heartbeat = loop.create_task(self.beat())
+    
+    async def stop(self):
+        for task in (self.listener, self.heartbeat):
+            if task is not None and task.get_loop() is asyncio.get_running_loop():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self.listener = None
+        self.heartbeat = None
+    
+    async def listen(self):
+        while True:
+            try:
+                async for envelope in self.bus.listen(self.channel):
+                    self.deliver(envelope)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Notification bus unavailable, reconnecting: %s", exc)
+                await asyncio.sleep(1)
+    
+    async def beat(self):
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            self.check_connections()
+
+manager = ConnectionManager(get_pubsub())
+
+async def deliver_events(events: List[DomainEvent]):
+    await asyncio.gather(*(
+        manager.send_personal_message({"type": event.type, "data": event.data}, event.user_id)
+        for event in events
+    ))
 
-manager = ConnectionManager()
+event_dispatcher.sink = deliver_events
 
-async def get_user_from_token(token: str, db: Session) -> User:
+connection_limiter = get_rate_limiter()
+
+async def get_user_from_token(token: str, session_factory: async_sessionmaker) -> User:
     payload = verify_token(token, "access")
     if not payload:
         raise HTTPException(
@@ -59,7 +232,20 @@ async def get_user_from_token(token: str, db: Session) -> User:
             detail="Invalid token payload"
         )
     
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    limit, window = settings.WS_CONNECT_RATE_LIMIT
+    if not await connection_limiter.hit(f"ws|{user_id}", limit, window):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many connection attempts"
+        )
+    
+    user = user_cache.get(int(user_id))
+    if user is None:
+        async with session_factory() as db:
+            user = await db.get(User, int(user_id))
+        if user:
+            cache_user(user)
+    
     if not user or user.is_banned:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -69,31 +255,38 @@ async def get_user_from_token(token: str, db: Session) -> User:
     return user
 
 @router.websocket("/ws/{user_id}")
-async def websocket_endpoint(websocket: WebSocket, user_id: int):
+async def websocket_endpoint(
+    websocket: WebSocket,
+    user_id: int,
+    session_factory: async_sessionmaker = Depends(get_sessionmaker)
+):
     try:
         token = websocket.query_params.get("token")
         if not token:
             await websocket.close(code=1008, reason="Token required")
             return
         
-        db = next(get_db())
         try:
-            user = await get_user_from_token(token, db)
-            if user.id != user_id:
-                await websocket.close(code=1008, reason="Invalid user")
-                return
-        finally:
-            db.close()
+            user = await get_user_from_token(token, session_factory)
+        except HTTPException as exc:
+            code = 1013 if exc.status_code == status.HTTP_429_TOO_MANY_REQUESTS else 1008
+            await websocket.close(code=code, reason=exc.detail)
+            return
         
-        await manager.connect(websocket, user_id)
+        if user.id != user_id:
+            await websocket.close(code=1008, reason="Invalid user")
+            return
+        
+        connection = await manager.connect(websocket, user_id)
         
         try:
             while True:
                 data = await websocket.receive_text()
+                connection.touch()
                 message_data = json.loads(data)
                 
                 if message_data.get("type") == "ping":
-                    await websocket.send_text(json.dumps({"type": "pong"}))
+                    connection.send(json.dumps({"type": "pong"}))
                 
         except WebSocketDisconnect:
             manager.disconnect(websocket, user_id)
@@ -103,9 +296,13 @@ async def websocket_endpoint(websocket: WebSocket, user_id: int):
     except Exception as e:
         try:
             await websocket.close(code=1011, reason="Internal error")
-        except:
+        except Exception:
             pass
 
+@router.get("/ws/metrics")
+async def websocket_metrics(current_user: User = Depends(get_current_admin_user)):
+    return manager.metrics()
+
 async def notify_swap_update(user_id: int, swap_data: dict):
     await manager.send_personal_message({
         "type": "swap_update",
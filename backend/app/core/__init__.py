@@ -1,10 +1,22 @@
-from .security import verify_password, get_password_hash, create_access_token, create_refresh_token, verify_token, create_csrf_token, verify_csrf_token
+from .security import verify_password, get_password_hash, verify_password_async, get_password_hash_async, PasswordHashPoolBusy, create_access_token, create_refresh_token, verify_token, create_csrf_token, verify_csrf_token
 from .deps import get_current_user, get_current_active_user, get_current_admin_user, get_optional_current_user
 from .middleware import RateLimitMiddleware
+from .cache import TTLCache, user_cache, cache_user, invalidate_cached_user
+from .catalogue import SkillCatalogue, skill_catalogue, etag_matches
+from .autocomplete import SkillSuggester, SuggestedSkill, skill_suggester
+from .matching import MatchIndex, SkillMatch, match_index
+from .cycles import SkillCycle, SwapCycleFinder, cycle_finder, cycle_cache, find_swap_cycles
+from .ratelimit import RateLimiter, InMemoryRateLimiter, RedisRateLimiter, get_rate_limiter
+from .events import DomainEvent, EventDispatcher, event_dispatcher, emit_event
+from .responses import FastJSONResponse, prebuilt_response
+from .pubsub import PubSub, InMemoryPubSub, RedisPubSub, PostgresPubSub, get_pubsub
 
 __all__ = [
     "verify_password",
     "get_password_hash", 
+    "verify_password_async",
+    "get_password_hash_async",
+    "PasswordHashPoolBusy",
     "create_access_token",
     "create_refresh_token",
     "verify_token",
@@ -14,5 +26,38 @@ __all__ = [
     "get_current_active_user", 
     "get_current_admin_user",
     "get_optional_current_user",
-    "RateLimitMiddleware"
+    "RateLimitMiddleware",
+    "TTLCache",
+    "user_cache",
+    "cache_user",
+    "invalidate_cached_user",
+    "SkillCatalogue",
+    "skill_catalogue",
+    "etag_matches",
+    "SkillSuggester",
+    "SuggestedSkill",
+    "skill_suggester",
+    "MatchIndex",
+    "SkillMatch",
+    "match_index",
+    "SkillCycle",
+    "SwapCycleFinder",
+    "cycle_finder",
+    "cycle_cache",
+    "find_swap_cycles",
+    "RateLimiter",
+    "InMemoryRateLimiter",
+    "RedisRateLimiter",
+    "get_rate_limiter",
+    "DomainEvent",
+    "EventDispatcher",
+    "event_dispatcher",
+    "emit_event",
+    "FastJSONResponse",
+    "prebuilt_response",
+    "PubSub",
+    "InMemoryPubSub",
+    "RedisPubSub",
+    "PostgresPubSub",
+    "get_pubsub"
 ]
\ No newline at end of file
@@ -0,0 +1,163 @@
+import asyncio
+import bisect
+import heapq
+import re
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, NamedTuple, Optional, Set
+from sqlalchemy import select
+from ..config import settings
+from ..models import Skill
+
+SUGGEST_SIMILARITY_THRESHOLD = 0.1
+SUGGEST_NODE_TOP_K = 32
+
+class SuggestedSkill(NamedTuple):
+    id: int
+    name: str
+    description: Optional[str]
+
+def normalize(text: str) -> str:
+    return " ".join(re.findall(r"[^\W_]+", text.lower()))
+
+def trigrams(text: str) -> Set[str]:
+    grams = set()
+    for word in normalize(text).split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+class TrieNode:
+    __slots__ = ("children", "skill_ids", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "TrieNode"] = {}
+        self.skill_ids: Set[int] = set()
+        self.top: List[int] = []
+
+class SkillSuggester:
+    def __init__(self, ttl: Optional[float] = None, clock=time.monotonic):
+        self.ttl = ttl
+        self.clock = clock
+        self.lock = asyncio.Lock()
+        self.clear()
+
+    def clear(self):
+        self.skills: Dict[int, SuggestedSkill] = {}
+        self.normalized: Dict[int, str] = {}
+        self.grams: Dict[int, Set[str]] = {}
+        self.trie = TrieNode()
+        self.trigram_index: Dict[str, Set[int]] = defaultdict(set)
+        self.loaded_at: Optional[float] = None
+
+    def is_stale(self) -> bool:
+        if self.loaded_at is None:
+            return True
+        return bool(self.ttl) and self.clock() - self.loaded_at >= self.ttl
+
+    async def ensure_loaded(self, db):
+        if not self.is_stale():
+            return
+        async with self.lock:
+            if self.is_stale():
+                await self.load(db)
+
+    async def load(self, db):
+        result = await db.execute(
+            select(Skill.id, Skill.name, Skill.description).where(Skill.is_approved == True)
+        )
+        rows = result.all()
+        self.clear()
+        for skill_id, name, description in rows:
+            self.add(skill_id, name, description)
+        self.loaded_at = self.clock()
+
+    def word_suffixes(self, name: str):
+        normalized = normalize(name)
+        for start in [0] + [match.end() for match in re.finditer(" ", normalized)]:
+            yield normalized[start:]
+
+    def rank_key(self, skill_id: int) -> tuple:
+        return len(self.normalized[skill_id]), self.normalized[skill_id], skill_id
+
+    def add(self, skill_id: int, name: str, description: Optional[str] = None):
+        self.remove(skill_id)
+        self.skills[skill_id] = SuggestedSkill(skill_id, name, description)
+        self.normalized[skill_id] = normalize(name)
+        for suffix in self.word_suffixes(name):
+            node = self.trie
+            for char in suffix:
+                node = node.children.setdefault(char, TrieNode())
+                if skill_id in node.skill_ids:
+                    continue
+                node.skill_ids.add(skill_id)
+                bisect.insort(node.top, skill_id, key=self.rank_key)
+                del node.top[SUGGEST_NODE_TOP_K:]
+        self.grams[skill_id] = trigrams(name)
+        for gram in self.grams[skill_id]:
+            self.trigram_index[gram].add(skill_id)
+
+    def remove(self, skill_id: int):
+        skill = self.skills.get(skill_id)
+        if skill is None:
+            return
+        for suffix in self.word_suffixes(skill.name):
+            node = self.trie
+            for char in suffix:
+                node = node.children.get(char)
+                if node is None:
+                    break
+                node.skill_ids.discard(skill_id)
+                if skill_id in node.top:
+                    node.top = heapq.nsmallest(SUGGEST_NODE_TOP_K, node.skill_ids, key=self.rank_key)
+        for gram in self.grams.pop(skill_id, ()):
+            holders = self.trigram_index.get(gram)
+            if holders is not None:
+                holders.discard(skill_id)
+                if not holders:
+                    del self.trigram_index[gram]
+        del self.skills[skill_id]
+        del self.normalized[skill_id]
+
+    def prefix_matches(self, prefix: str) -> List[int]:
+        node = self.trie
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.top
+
+    def similarity(self, query_grams: Set[str], skill_id: int) -> float:
+        overlap = len(query_grams & self.grams[skill_id])
+        return overlap / (len(query_grams) + len(self.grams[skill_id]) - overlap)
+
+    def suggest(self, q: str, limit: int = 10) -> List[SuggestedSkill]:
+        query = normalize(q)
+        if not query:
+            return []
+
+        query_grams = trigrams(query)
+        scores: Dict[int, float] = {}
+        for skill_id in self.prefix_matches(query):
+            bonus = 1.5 if self.normalized[skill_id].startswith(query) else 1.0
+            scores[skill_id] = bonus + self.similarity(query_grams, skill_id)
+
+        if len(scores) < limit:
+            shared = Counter()
+            for gram in query_grams:
+                shared.update(self.trigram_index.get(gram, ()))
+            for skill_id, overlap in shared.items():
+                if skill_id in scores:
+                    continue
+                similarity = overlap / (len(query_grams) + len(self.grams[skill_id]) - overlap)
+                if similarity >= SUGGEST_SIMILARITY_THRESHOLD:
+                    scores[skill_id] = similarity
+
+        ranked = heapq.nsmallest(
+            limit,
+            scores.items(),
+            key=lambda item: (-item[1], self.normalized[item[0]], item[0])
+        )
+        return [self.skills[skill_id] for skill_id, _ in ranked]
+
+skill_suggester = SkillSuggester(ttl=settings.SKILL_SUGGEST_TTL)
@@ -0,0 +1,54 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from ..config import settings
+from ..models import User
+
+class TTLCache:
+    def __init__(self, ttl: float, maxsize: int = 10000, clock=time.monotonic):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.clock = clock
+        self.entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self.entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        self.entries.pop(key, None)
+        self.entries[key] = (self.clock() + self.ttl, value)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        self.entries.pop(key, None)
+
+    def clear(self):
+        self.entries.clear()
+
+user_cache = TTLCache(ttl=settings.USER_CACHE_TTL, maxsize=settings.USER_CACHE_SIZE)
+
+def snapshot_user(user: User) -> User:
+    loaded = inspect(user).dict
+    snapshot = User(**{
+        column.key: loaded[column.key]
+        for column in inspect(User).column_attrs
+        if column.key in loaded
+    })
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+def cache_user(user: User):
+    user_cache.set(user.id, snapshot_user(user))
+
+def invalidate_cached_user(user_id: int):
+    user_cache.invalidate(user_id)
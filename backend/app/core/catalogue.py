@@ -0,0 +1,55 @@
+import hashlib
+import json
+import time
+from typing import NamedTuple, Optional
+from sqlalchemy import select
+from ..config import settings
+from ..models import Skill
+
+class CatalogueSnapshot(NamedTuple):
+    version: int
+    loaded_at: float
+    etag: str
+    body: bytes
+
+class SkillCatalogue:
+    def __init__(self, ttl: Optional[float] = None, clock=time.monotonic):
+        self.ttl = ttl
+        self.clock = clock
+        self.version = 0
+        self.snapshot: Optional[CatalogueSnapshot] = None
+
+    def invalidate(self):
+        self.version += 1
+        self.snapshot = None
+
+    def is_fresh(self, snapshot: Optional[CatalogueSnapshot]) -> bool:
+        if snapshot is None or snapshot.version != self.version:
+            return False
+        return not self.ttl or self.clock() - snapshot.loaded_at < self.ttl
+
+    async def get(self, db) -> CatalogueSnapshot:
+        snapshot = self.snapshot
+        if self.is_fresh(snapshot):
+            return snapshot
+
+        version = self.version
+        result = await db.execute(
+            select(Skill.id, Skill.name, Skill.description).where(Skill.is_approved == True).order_by(Skill.name)
+        )
+        body = json.dumps(
+            [{"id": skill_id, "name": name, "description": description} for skill_id, name, description in result],
+            separators=(",", ":")
+        ).encode()
+        snapshot = CatalogueSnapshot(version, self.clock(), f'"{hashlib.sha256(body).hexdigest()[:32]}"', body)
+        if version == self.version:
+            self.snapshot = snapshot
+        return snapshot
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+skill_catalogue = SkillCatalogue(ttl=settings.SKILL_CATALOGUE_TTL)
@@ -0,0 +1,89 @@
+import heapq
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Set, Tuple
+from ..config import settings
+from .cache import TTLCache
+from .matching import AVAILABILITY_RANK, MatchIndex, match_index
+
+MAX_CYCLE_LENGTH = 4
+
+class SkillCycle(NamedTuple):
+    user_ids: Tuple[int, ...]
+    skill_ids: Tuple[FrozenSet[int], ...]
+
+class SwapCycleFinder:
+    def __init__(self, index: MatchIndex, max_branching: int = 200, max_cycles: int = 50):
+        self.index = index
+        self.max_branching = max_branching
+        self.max_cycles = max_cycles
+
+    def learners(self, user_id: int) -> Set[int]:
+        found = set()
+        for skill_id in self.index.users[user_id].offered:
+            found.update(self.index.wanted_by.get(skill_id, ()))
+        return self.searchable(found, user_id)
+
+    def teachers(self, user_id: int) -> Set[int]:
+        found = set()
+        for skill_id in self.index.users[user_id].wanted:
+            found.update(self.index.offered_by.get(skill_id, ()))
+        return self.searchable(found, user_id)
+
+    def searchable(self, user_ids: Iterable[int], exclude: int) -> Set[int]:
+        users = self.index.users
+        return {user_id for user_id in user_ids if user_id != exclude and users[user_id].searchable}
+
+    def bounded(self, user_ids: Set[int]) -> Set[int]:
+        if len(user_ids) <= self.max_branching:
+            return user_ids
+        return set(heapq.nlargest(self.max_branching, user_ids, key=self.priority))
+
+    def priority(self, user_id: int) -> tuple:
+        entry = self.index.users[user_id]
+        return AVAILABILITY_RANK.get(entry.availability, 0), entry.average_rating or 0, -user_id
+
+    def find(self, user_id: int, max_length: int = MAX_CYCLE_LENGTH) -> List[SkillCycle]:
+        me = self.index.users.get(user_id)
+        if me is None or not me.offered or not me.wanted:
+            return []
+
+        after = self.bounded(self.learners(user_id))
+        before = self.teachers(user_id)
+        paths: List[Tuple[int, ...]] = [(user_id, a) for a in sorted(after & before)]
+
+        if max_length >= 3 and len(paths) < self.max_cycles:
+            for a in sorted(after):
+                paths.extend((user_id, a, b) for b in sorted(self.learners(a) & before))
+                if len(paths) >= self.max_cycles:
+                    break
+
+        if max_length >= 4 and len(paths) < self.max_cycles:
+            two_back: Dict[int, Set[int]] = defaultdict(set)
+            for c in self.bounded(before):
+                for b in self.bounded(self.teachers(c)):
+                    if b != user_id:
+                        two_back[b].add(c)
+            for a in sorted(after):
+                for b in sorted(self.learners(a) & two_back.keys()):
+                    paths.extend((user_id, a, b, c) for c in sorted(two_back[b]) if c != a)
+                if len(paths) >= self.max_cycles:
+                    break
+
+        return [self.build(path) for path in paths[:self.max_cycles]]
+
+    def build(self, path: Tuple[int, ...]) -> SkillCycle:
+        users = self.index.users
+        return SkillCycle(path, tuple(
+            users[teacher].offered & users[learner].wanted
+            for teacher, learner in zip(path, path[1:] + path[:1])
+        ))
+
+cycle_finder = SwapCycleFinder(match_index, max_branching=settings.SWAP_CYCLE_MAX_BRANCHING)
+cycle_cache = TTLCache(ttl=settings.SWAP_CYCLE_CACHE_TTL, maxsize=settings.USER_CACHE_SIZE)
+
+def find_swap_cycles(user_id: int) -> List[SkillCycle]:
+    cycles = cycle_cache.get(user_id)
+    if cycles is None:
+        cycles = cycle_finder.find(user_id)
+        cycle_cache.set(user_id, cycles)
+    return cycles
@@ -1,14 +1,15 @@
 from typing import Optional
 from fastapi import Depends, HTTPException, status, Request, Cookie
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from ..database import get_db
 from ..models import User
 from .security import verify_token
+from .cache import user_cache, cache_user
 
 async def get_current_user(
     request: Request,
     access_token: Optional[str] = Cookie(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> Optional[User]:
     if not access_token:
         return None
@@ -21,7 +22,14 @@ async def get_current_user(
     if not user_id:
         return None
     
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    cached_user = user_cache.get(int(user_id))
+    if cached_user is not None:
+        user = await db.merge(cached_user, load=False)
+    else:
+        user = await db.get(User, int(user_id))
+        if user:
+            cache_user(user)
+    
     if not user or user.is_banned:
         return None
     
@@ -0,0 +1,84 @@
+import asyncio
+import itertools
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, List, NamedTuple, Optional
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+class DomainEvent(NamedTuple):
+    user_id: int
+    type: str
+    data: Any
+    key: Optional[Hashable] = None
+
+class EventDispatcher:
+    def __init__(self, flush_interval: float = 0.05, batch_size: int = 500):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.sink: Optional[Callable[[List[DomainEvent]], Awaitable]] = None
+        self.pending: "OrderedDict[tuple, DomainEvent]" = OrderedDict()
+        self.sequence = itertools.count()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.wakeup: Optional[asyncio.Event] = None
+        self.worker: Optional[asyncio.Task] = None
+
+    def emit(self, event: DomainEvent):
+        if event.key is None:
+            coalesce_key = (event.user_id, event.type, next(self.sequence))
+        else:
+            coalesce_key = (event.user_id, event.type, event.key)
+        self.pending.pop(coalesce_key, None)
+        self.pending[coalesce_key] = event
+        self.start()
+        self.wakeup.set()
+
+    def start(self):
+        loop = asyncio.get_running_loop()
+        if self.loop is not loop or self.worker is None or self.worker.done():
+            self.loop = loop
+            self.wakeup = asyncio.Event()
+            self.worker = loop.create_task(self.run())
+            if self.pending:
+                self.wakeup.set()
+
+    async def run(self):
+        while True:
+            await self.wakeup.wait()
+            await asyncio.sleep(self.flush_interval)
+            self.wakeup.clear()
+            await self.flush()
+
+    async def flush(self):
+        while self.pending:
+            batch = []
+            while self.pending and len(batch) < self.batch_size:
+                batch.append(self.pending.popitem(last=False)[1])
+            if self.sink is None:
+                continue
+            try:
+                await self.sink(batch)
+            except Exception:
+                logger.exception("Failed to deliver %d domain events", len(batch))
+
+    async def stop(self):
+        if self.worker is not None and self.loop is asyncio.get_running_loop():
+            self.worker.cancel()
+            try:
+                await self.worker
+            except asyncio.CancelledError:
+                pass
+        self.worker = None
+        await self.flush()
+
+    def clear(self):
+        self.pending.clear()
+
+event_dispatcher = EventDispatcher(
+    flush_interval=settings.EVENT_FLUSH_INTERVAL,
+    batch_size=settings.EVENT_BATCH_SIZE
+)
+
+def emit_event(user_id: int, type: str, data: Any, key: Optional[Hashable] = None):
+    event_dispatcher.emit(DomainEvent(user_id, type, data, key))
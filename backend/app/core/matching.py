@@ -0,0 +1,213 @@
+import asyncio
+import heapq
+import logging
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+from sqlalchemy import select
+from ..config import settings
+from ..models import User, skills_offered, skills_wanted
+
+logger = logging.getLogger(__name__)
+
+AVAILABILITY_RANK = {"available": 2, "busy": 1}
+
+class IndexedUser:
+    __slots__ = ("offered", "wanted", "searchable", "availability", "average_rating")
+
+    def __init__(
+        self,
+        offered: FrozenSet[int],
+        wanted: FrozenSet[int],
+        searchable: bool,
+        availability: Optional[str],
+        average_rating: Optional[float]
+    ):
+        self.offered = offered
+        self.wanted = wanted
+        self.searchable = searchable
+        self.availability = availability
+        self.average_rating = average_rating
+
+class SkillMatch(NamedTuple):
+    user_id: int
+    offered_skill_ids: FrozenSet[int]
+    wanted_skill_ids: FrozenSet[int]
+    overlap: int
+
+class MatchIndex:
+    def __init__(self, ttl: Optional[float] = None, clock=time.monotonic):
+        self.ttl = ttl
+        self.clock = clock
+        self.lock = asyncio.Lock()
+        self.refresher: Optional[asyncio.Task] = None
+        self.pending: Optional[List[Tuple[str, tuple, Dict[str, Any]]]] = None
+        self.clear()
+
+    def clear(self):
+        self.users: Dict[int, IndexedUser] = {}
+        self.offered_by: Dict[int, Set[int]] = defaultdict(set)
+        self.wanted_by: Dict[int, Set[int]] = defaultdict(set)
+        self.loaded_at: Optional[float] = None
+
+    def is_stale(self) -> bool:
+        if self.loaded_at is None:
+            return True
+        return bool(self.ttl) and self.clock() - self.loaded_at >= self.ttl
+
+    async def ensure_loaded(self, session_factory):
+        if self.loaded_at is None:
+            async with self.lock:
+                if self.loaded_at is None:
+                    await self.rebuild(session_factory)
+        elif self.is_stale():
+            self.schedule_refresh(session_factory)
+
+    def schedule_refresh(self, session_factory):
+        loop = asyncio.get_running_loop()
+        if self.refresher is None or self.refresher.done() or self.refresher.get_loop() is not loop:
+            self.refresher = loop.create_task(self.refresh(session_factory))
+
+    async def refresh(self, session_factory):
+        try:
+            async with self.lock:
+                if self.is_stale():
+                    await self.rebuild(session_factory)
+        except Exception:
+            logger.exception("Failed to rebuild the match index")
+
+    async def rebuild(self, session_factory):
+        self.pending = []
+        try:
+            fresh = MatchIndex(self.ttl, self.clock)
+            async with session_factory() as db:
+                await fresh.load(db)
+            # Changes indexed while the snapshot was being read may be missing from it.
+            for method, args, kwargs in self.pending:
+                getattr(fresh, method)(*args, **kwargs)
+        finally:
+            self.pending = None
+        self.users, self.offered_by, self.wanted_by = fresh.users, fresh.offered_by, fresh.wanted_by
+        self.loaded_at = fresh.loaded_at
+
+    async def stop(self):
+        if self.refresher is not None and self.refresher.get_loop() is asyncio.get_running_loop():
+            self.refresher.cancel()
+            try:
+                await self.refresher
+            except asyncio.CancelledError:
+                pass
+        self.refresher = None
+
+    def remember(self, method: str, *args, **kwargs):
+        if self.pending is not None:
+            self.pending.append((method, args, kwargs))
+
+    async def load(self, db):
+        offered: Dict[int, Set[int]] = defaultdict(set)
+        wanted: Dict[int, Set[int]] = defaultdict(set)
+        for user_id, skill_id in await db.execute(select(skills_offered.c.user_id, skills_offered.c.skill_id)):
+            offered[user_id].add(skill_id)
+        for user_id, skill_id in await db.execute(select(skills_wanted.c.user_id, skills_wanted.c.skill_id)):
+            wanted[user_id].add(skill_id)
+
+        users = await db.execute(select(
+            User.id, User.is_public, User.is_banned, User.availability, User.rating_count, User.rating_sum
+        ))
+        self.clear()
+        for user_id, is_public, is_banned, availability, rating_count, rating_sum in users:
+            self.set_user(
+                user_id,
+                offered.get(user_id, ()),
+                wanted.get(user_id, ()),
+                searchable=bool(is_public) and not is_banned,
+                availability=availability,
+                average_rating=rating_sum / rating_count if rating_count else None
+            )
+        self.loaded_at = self.clock()
+
+    def set_user(
+        self,
+        user_id: int,
+        offered: Iterable[int],
+        wanted: Iterable[int],
+        searchable: bool = True,
+        availability: Optional[str] = "available",
+        average_rating: Optional[float] = None
+    ):
+        self.discard(user_id)
+        entry = self.users[user_id] = IndexedUser(
+            frozenset(offered), frozenset(wanted), searchable, availability, average_rating
+        )
+        for skill_id in entry.offered:
+            self.offered_by[skill_id].add(user_id)
+        for skill_id in entry.wanted:
+            self.wanted_by[skill_id].add(user_id)
+
+    def index_user(self, user: User):
+        offered = frozenset(skill.id for skill in user.offered_skills)
+        wanted = frozenset(skill.id for skill in user.wanted_skills)
+        attributes = {
+            "searchable": bool(user.is_public) and not user.is_banned,
+            "availability": user.availability,
+            "average_rating": user.average_rating
+        }
+        self.remember("set_user", user.id, offered, wanted, **attributes)
+        if self.loaded_at is not None:
+            self.set_user(user.id, offered, wanted, **attributes)
+
+    def update_user(self, user_id: int, **attributes):
+        self.remember("update_user", user_id, **attributes)
+        entry = self.users.get(user_id)
+        if entry is None:
+            return
+        for name, value in attributes.items():
+            setattr(entry, name, value)
+
+    def discard(self, user_id: int):
+        entry = self.users.pop(user_id, None)
+        if entry is None:
+            return
+        for index, skill_ids in ((self.offered_by, entry.offered), (self.wanted_by, entry.wanted)):
+            for skill_id in skill_ids:
+                holders = index.get(skill_id)
+                if holders is not None:
+                    holders.discard(user_id)
+                    if not holders:
+                        del index[skill_id]
+
+    def matches(self, user_id: int, limit: int = 20) -> List[SkillMatch]:
+        me = self.users.get(user_id)
+        if me is None:
+            return []
+
+        gives = Counter()
+        for skill_id in me.wanted:
+            gives.update(self.offered_by.get(skill_id, ()))
+        takes = Counter()
+        for skill_id in me.offered:
+            takes.update(self.wanted_by.get(skill_id, ()))
+
+        candidates = []
+        for candidate_id in gives.keys() & takes.keys():
+            entry = self.users[candidate_id]
+            if candidate_id == user_id or not entry.searchable:
+                continue
+            candidates.append((
+                gives[candidate_id] + takes[candidate_id],
+                entry.average_rating or 0,
+                AVAILABILITY_RANK.get(entry.availability, 0),
+                -candidate_id
+            ))
+
+        return [
+            SkillMatch(
+                -negative_id,
+                self.users[-negative_id].offered & me.wanted,
+                self.users[-negative_id].wanted & me.offered,
+                overlap
+            )
+            for overlap, _, _, negative_id in heapq.nlargest(limit, candidates)
+        ]
+
+match_index = MatchIndex(ttl=settings.MATCH_INDEX_TTL)
@@ -1,43 +1,57 @@
-import time
-from typing import Dict
-from fastapi import Request, HTTPException, status
+from typing import Dict, Optional, Sequence, Tuple
+from fastapi import status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 from ..config import settings
+from .ratelimit import RateLimiter, get_rate_limiter
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app):
-        super().__init__(app)
-        self.requests: Dict[str, list] = {}
-    
-    async def dispatch(self, request: Request, call_next):
-        if request.url.path.startswith("/ws"):
-            return await call_next(request)
-        
-        client_ip = self.get_client_ip(request)
-        current_time = time.time()
-        
-        if client_ip not in self.requests:
-            self.requests[client_ip] = []
-        
-        self.requests[client_ip] = [
-            req_time for req_time in self.requests[client_ip]
-            if current_time - req_time < settings.RATE_LIMIT_SECONDS
-        ]
-        
-        if len(self.requests[client_ip]) >= settings.RATE_LIMIT_REQUESTS:
-            return JSONResponse(
+class RateLimitMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: Optional[RateLimiter] = None,
+        policies: Optional[Dict[str, Sequence[int]]] = None
+    ):
+        self.app = app
+        self.limiter = limiter or get_rate_limiter()
+        if policies is None:
+            policies = settings.RATE_LIMIT_POLICIES
+        self.policies = sorted(
+            ((prefix, int(limit), int(window)) for prefix, (limit, window) in policies.items()),
+            key=lambda policy: len(policy[0]),
+            reverse=True
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        prefix, limit, window = self.get_policy(scope["path"])
+        client_ip = self.get_client_ip(scope)
+        key = f"{prefix}|{client_ip}" if prefix else client_ip
+
+        if not await self.limiter.hit(key, limit, window):
+            response = JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                content={"detail": "Rate limit exceeded"}
+                content={"detail": "Rate limit exceeded"},
+                headers={"Retry-After": str(window)}
             )
-        
-        self.requests[client_ip].append(current_time)
-        
-        response = await call_next(request)
-        return response
-    
-    def get_client_ip(self, request: Request) -> str:
-        forwarded = request.headers.get("X-Forwarded-For")
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    def get_policy(self, path: str) -> Tuple[str, int, int]:
+        for prefix, limit, window in self.policies:
+            if path.startswith(prefix):
+                return prefix, limit, window
+        return "", settings.RATE_LIMIT_REQUESTS, settings.RATE_LIMIT_SECONDS
+
+    def get_client_ip(self, scope: Scope) -> str:
+        forwarded = Headers(scope=scope).get("X-Forwarded-For")
         if forwarded:
             return forwarded.split(",")[0].strip()
-        return request.client.host
\ No newline at end of file
+        client = scope.get("client")
+        return client[0] if client else "unknown"
@@ -0,0 +1,86 @@
+import asyncio
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import AsyncIterator, Dict, Set
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from ..config import settings
+
+class PubSub(ABC):
+    @abstractmethod
+    async def publish(self, channel: str, message: str):
+        ...
+
+    @abstractmethod
+    def listen(self, channel: str) -> AsyncIterator[str]:
+        ...
+
+class InMemoryPubSub(PubSub):
+    def __init__(self):
+        self.subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+
+    async def publish(self, channel: str, message: str):
+        for queue in list(self.subscribers.get(channel, ())):
+            queue.put_nowait(message)
+
+    async def listen(self, channel: str) -> AsyncIterator[str]:
+        queue = asyncio.Queue()
+        self.subscribers[channel].add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self.subscribers[channel].discard(queue)
+
+class RedisPubSub(PubSub):
+    def __init__(self, client):
+        self.client = client
+
+    async def publish(self, channel: str, message: str):
+        await self.client.publish(channel, message)
+
+    async def listen(self, channel: str) -> AsyncIterator[str]:
+        pubsub = self.client.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            async for item in pubsub.listen():
+                if item["type"] != "message":
+                    continue
+                data = item["data"]
+                yield data.decode() if isinstance(data, bytes) else data
+        finally:
+            await pubsub.reset()
+
+class PostgresPubSub(PubSub):
+    def __init__(self, database_url: str):
+        self.dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+    async def publish(self, channel: str, message: str):
+        from ..database import engine
+        async with engine.begin() as conn:
+            await conn.execute(text("SELECT pg_notify(:channel, :message)"), {"channel": channel, "message": message})
+
+    async def listen(self, channel: str) -> AsyncIterator[str]:
+        import asyncpg
+        queue = asyncio.Queue()
+        connection = await asyncpg.connect(self.dsn)
+        connection.add_termination_listener(
+            lambda conn: queue.put_nowait(ConnectionError("Postgres notification connection closed"))
+        )
+        await connection.add_listener(channel, lambda conn, pid, channel, payload: queue.put_nowait(payload))
+        try:
+            while True:
+                payload = await queue.get()
+                if isinstance(payload, Exception):
+                    raise payload
+                yield payload
+        finally:
+            await connection.close()
+
+def get_pubsub() -> PubSub:
+    if settings.PUBSUB_BACKEND == "redis":
+        from redis import asyncio as aioredis
+        return RedisPubSub(aioredis.from_url(settings.REDIS_URL))
+    if settings.PUBSUB_BACKEND == "postgres":
+        return PostgresPubSub(settings.DATABASE_DIRECT_URL or settings.DATABASE_URL)
+    return InMemoryPubSub()
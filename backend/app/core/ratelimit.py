@@ -0,0 +1,99 @@
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Optional
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+class RateLimiter(ABC):
+    @abstractmethod
+    async def hit(self, key: str, limit: int, window: float) -> bool:
+        ...
+
+def sliding_window_count(previous: int, current: int, elapsed: float, window: float) -> float:
+    return previous * (1 - elapsed / window) + current
+
+class WindowState:
+    __slots__ = ("index", "current", "previous", "last_seen")
+
+    def __init__(self, index: int, now: float):
+        self.index = index
+        self.current = 0
+        self.previous = 0
+        self.last_seen = now
+
+class InMemoryRateLimiter(RateLimiter):
+    def __init__(self, idle_ttl: Optional[float] = None, clock=time.monotonic):
+        self.idle_ttl = idle_ttl
+        self.clock = clock
+        self.windows: "Dict[float, OrderedDict[str, WindowState]]" = {}
+
+    async def hit(self, key: str, limit: int, window: float) -> bool:
+        now = self.clock()
+        self.evict_idle(now)
+
+        window_index = int(now // window)
+        states = self.windows.setdefault(window, OrderedDict())
+        state = states.get(key)
+        if state is None:
+            state = states[key] = WindowState(window_index, now)
+        else:
+            states.move_to_end(key)
+
+        if state.index != window_index:
+            state.previous = state.current if window_index - state.index == 1 else 0
+            state.index = window_index
+            state.current = 0
+        state.last_seen = now
+
+        elapsed = now - window_index * window
+        if sliding_window_count(state.previous, state.current, elapsed, window) >= limit:
+            return False
+
+        state.current += 1
+        return True
+
+    def evict_idle(self, now: float):
+        for window, states in self.windows.items():
+            ttl = max(self.idle_ttl or 0, 2 * window)
+            while states:
+                key, state = next(iter(states.items()))
+                if now - state.last_seen < ttl:
+                    break
+                del states[key]
+
+class RedisRateLimiter(RateLimiter):
+    def __init__(self, client, prefix: str = "ratelimit", clock=time.time):
+        self.client = client
+        self.prefix = prefix
+        self.clock = clock
+
+    async def hit(self, key: str, limit: int, window: float) -> bool:
+        now = self.clock()
+        window_index = int(now // window)
+        current_key = f"{self.prefix}:{key}:{window_index}"
+        previous_key = f"{self.prefix}:{key}:{window_index - 1}"
+
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.incr(current_key)
+                pipe.expire(current_key, int(2 * window) + 1)
+                pipe.get(previous_key)
+                current, _, previous = await pipe.execute()
+
+            elapsed = now - window_index * window
+            if sliding_window_count(int(previous or 0), current - 1, elapsed, window) >= limit:
+                await self.client.decr(current_key)
+                return False
+        except Exception as exc:
+            logger.warning("Rate limiter backend unavailable, allowing request: %s", exc)
+
+        return True
+
+def get_rate_limiter() -> RateLimiter:
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        from redis import asyncio as aioredis
+        return RedisRateLimiter(aioredis.from_url(settings.REDIS_URL))
+    return InMemoryRateLimiter(idle_ttl=settings.RATE_LIMIT_IDLE_TTL)
@@ -0,0 +1,27 @@
+import json
+from typing import Any
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from ..config import settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dump_model(obj: Any):
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, default=dump_model, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+        return json.dumps(jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")).encode()
+
+def prebuilt_response(content: Any, status_code: int = 200):
+    if not settings.FAST_JSON_RESPONSES:
+        return content
+    return FastJSONResponse(content, status_code=status_code)
@@ -1,29 +1,138 @@
-from sqlalchemy import create_engine, text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+import os
+import time
+from typing import Tuple
+from uuid import uuid4
+from sqlalchemy import exc, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession, AsyncEngine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 from .config import settings
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    echo=False
-)
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def get_async_database_url(url: str) -> str:
+    scheme, sep, rest = url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+class PoolStats:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.checked_out = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_checkout(self, wait: float):
+        self.checked_out += 1
+        self.checkouts += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+
+pool_stats = PoolStats()
+
+class TimedCheckoutMixin:
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            pool_stats.timeouts += 1
+            raise
+        pool_stats.record_checkout(time.perf_counter() - start)
+        return connection
+
+    def _do_return_conn(self, record):
+        pool_stats.checked_out -= 1
+        super()._do_return_conn(record)
+
+class InstrumentedQueuePool(TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+class InstrumentedNullPool(TimedCheckoutMixin, NullPool):
+    pass
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def get_pool_size() -> Tuple[int, int]:
+    if settings.DB_MAX_CONNECTIONS is None:
+        return settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+    budget = max(1, settings.DB_MAX_CONNECTIONS // max(1, settings.WEB_CONCURRENCY))
+    pool_size = min(settings.DB_POOL_SIZE, budget)
+    return pool_size, min(settings.DB_MAX_OVERFLOW, budget - pool_size)
+
+def get_engine_options(url: str) -> dict:
+    options = {"pool_pre_ping": settings.DB_POOL_PRE_PING, "echo": False}
+    if settings.DB_EXTERNAL_POOLER:
+        options["poolclass"] = InstrumentedNullPool
+        if url.startswith("postgresql+asyncpg"):
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+        return options
+    if make_url(url).database in (None, "", ":memory:"):
+        return options
+
+    pool_size, max_overflow = get_pool_size()
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE
+    )
+    return options
+
+def pool_metrics(engine: AsyncEngine) -> dict:
+    pool = engine.pool
+    metrics = {
+        "pid": os.getpid(),
+        "pool": type(pool).__name__,
+        "checked_out": pool_stats.checked_out,
+        "checkouts": pool_stats.checkouts,
+        "timeouts": pool_stats.timeouts,
+        "wait_avg_ms": pool_stats.wait_total / pool_stats.checkouts * 1000 if pool_stats.checkouts else 0.0,
+        "wait_max_ms": pool_stats.wait_max * 1000
+    }
+    if isinstance(pool, QueuePool):
+        metrics.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            overflow=max(0, pool.overflow()),
+            timeout=pool.timeout()
+        )
+    return metrics
+
+DATABASE_URL = get_async_database_url(settings.DATABASE_URL)
+
+engine = create_async_engine(DATABASE_URL, **get_engine_options(DATABASE_URL))
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
 
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
-
-def init_db():
-    Base.metadata.create_all(bind=engine)
-    
-    with engine.connect() as conn:
-        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm;"))
-        conn.commit()
\ No newline at end of file
+
+def get_sessionmaker():
+    return AsyncSessionLocal
+
+async def init_db():
+    async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm;"))
+        await conn.run_sync(Base.metadata.create_all)
@@ -5,9 +5,9 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.exc import IntegrityError
 import os
 from .config import settings
-from .database import init_db
-from .core import RateLimitMiddleware
-from .api import auth, users, skills, swaps, ratings, admin, websocket
+from .database import init_db, AsyncSessionLocal
+from .core import RateLimitMiddleware, PasswordHashPoolBusy, event_dispatcher, skill_suggester, match_index
+from .api import auth, users, skills, swaps, ratings, admin, matches, websocket
 
 app = FastAPI(
     title="Skill Swap API",
@@ -34,6 +34,7 @@ app.include_router(skills.router, prefix="/api")
 app.include_router(swaps.router, prefix="/api")
 app.include_router(ratings.router, prefix="/api")
 app.include_router(admin.router, prefix="/api")
+app.include_router(matches.router, prefix="/api")
 app.include_router(websocket.router, prefix="/api")
 
 @app.exception_handler(IntegrityError)
@@ -43,6 +44,14 @@ async def integrity_error_handler(request: Request, exc: IntegrityError):
         content={"detail": "Database constraint violation"}
     )
 
+@app.exception_handler(PasswordHashPoolBusy)
+async def password_hash_pool_busy_handler(request: Request, exc: PasswordHashPoolBusy):
+    return JSONResponse(
+        status_code=429,
+        content={"detail": "Too many authentication requests, please retry shortly"},
+        headers={"Retry-After": "1"}
+    )
+
 @app.exception_handler(ValueError)
 async def value_error_handler(request: Request, exc: ValueError):
     return JSONResponse(
@@ -52,7 +61,15 @@ async def value_error_handler(request: Request, exc: ValueError):
 
 @app.on_event("startup")
 async def startup_event():
-    init_db()
+    await init_db()
+    async with AsyncSessionLocal() as db:
+        await skill_suggester.load(db)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await event_dispatcher.stop()
+    await websocket.manager.stop()
+    await match_index.stop()
 
 @app.get("/")
 async def root():
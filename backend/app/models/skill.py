@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, Index
+from sqlalchemy import Column, String, Boolean, Index, func
 from sqlalchemy.orm import relationship
 from .base import BaseModel
 from .user import skills_offered, skills_wanted
@@ -16,4 +16,5 @@ class Skill(BaseModel):
     offered_swaps = relationship("SwapRequest", foreign_keys="SwapRequest.offered_skill_id", back_populates="offered_skill")
     wanted_swaps = relationship("SwapRequest", foreign_keys="SwapRequest.wanted_skill_id", back_populates="wanted_skill")
 
-Index('idx_skills_name_trgm', Skill.name, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
\ No newline at end of file
+Index('idx_skills_name_trgm', Skill.name, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+Index('uq_skills_name_lower', func.lower(Skill.name), unique=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Enum, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Enum, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from .base import BaseModel
 import enum
@@ -26,4 +26,7 @@ class SwapRequest(BaseModel):
     offered_skill = relationship("Skill", foreign_keys=[offered_skill_id], back_populates="offered_swaps")
     wanted_skill = relationship("Skill", foreign_keys=[wanted_skill_id], back_populates="wanted_swaps")
     
-    rating = relationship("Rating", back_populates="swap_request", uselist=False)
\ No newline at end of file
+    rating = relationship("Rating", back_populates="swap_request", uselist=False)
+
+Index('idx_swap_requests_requester_status_created', SwapRequest.requester_id, SwapRequest.status, SwapRequest.created_at)
+Index('idx_swap_requests_responder_status_created', SwapRequest.responder_id, SwapRequest.status, SwapRequest.created_at)
\ No newline at end of file
@@ -1,5 +1,6 @@
-from sqlalchemy import Column, String, Boolean, Text, Table, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Boolean, Text, Table, ForeignKey, Index, true, false
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from .base import BaseModel
 
 skills_offered = Table(
@@ -24,10 +25,19 @@ class User(BaseModel):
     password_hash = Column(String(255), nullable=False)
     avatar_url = Column(String(255), nullable=True)
     bio = Column(Text, nullable=True)
-    is_public = Column(Boolean, default=True)
-    is_banned = Column(Boolean, default=False)
-    is_admin = Column(Boolean, default=False)
+    is_public = Column(Boolean, default=True, server_default=true())
+    is_banned = Column(Boolean, default=False, server_default=false())
+    is_admin = Column(Boolean, default=False, server_default=false())
     availability = Column(String(50), default="available")
+    search_vector = deferred(Column(TSVECTOR().with_variant(Text(), "sqlite"), nullable=True))
+    
+    rating_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_1 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_2 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_3 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_4 = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_5 = Column(Integer, nullable=False, default=0, server_default="0")
     
     offered_skills = relationship("Skill", secondary=skills_offered, back_populates="offering_users")
     wanted_skills = relationship("Skill", secondary=skills_wanted, back_populates="wanting_users")
@@ -36,4 +46,18 @@ class User(BaseModel):
     received_requests = relationship("SwapRequest", foreign_keys="SwapRequest.responder_id", back_populates="responder")
     
     given_ratings = relationship("Rating", foreign_keys="Rating.rater_id", back_populates="rater")
-    received_ratings = relationship("Rating", foreign_keys="Rating.rated_id", back_populates="rated")
\ No newline at end of file
+    received_ratings = relationship("Rating", foreign_keys="Rating.rated_id", back_populates="rated")
+    
+    @property
+    def average_rating(self):
+        if not self.rating_count:
+            return None
+        return self.rating_sum / self.rating_count
+    
+    @property
+    def rating_histogram(self):
+        return {stars: getattr(self, f"rating_{stars}") or 0 for stars in range(1, 6)}
+
+Index('idx_users_search_vector', User.search_vector, postgresql_using='gin')
+Index('idx_users_name_trgm', User.name, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+Index('idx_users_rating_count', User.rating_count)
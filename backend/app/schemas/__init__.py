@@ -1,8 +1,10 @@
 from .auth import UserRegister, UserLogin, Token, TokenData, RefreshToken
 from .user import UserBase, UserCreate, UserUpdate, UserProfile, UserPublic, UserSearch
-from .skill import SkillBase, SkillCreate, SkillUpdate, Skill, SkillSearchResult
+from .skill import SkillBase, SkillCreate, SkillBulkCreate, SkillBulkCreateResult, SkillUpdate, Skill, SkillSearchResult
 from .swap import SwapRequestBase, SwapRequestCreate, SwapRequestUpdate, SwapRequestResponse, MySwapsResponse
 from .rating import RatingCreate, RatingResponse
+from .match import SwapMatch, SwapCycleStep, SwapCycle
+from .admin import AdminUser, AdminSwap, AdminUserPage, AdminSkillPage, AdminSwapPage
 
 __all__ = [
     "UserRegister",
@@ -18,6 +20,8 @@ __all__ = [
     "UserSearch",
     "SkillBase",
     "SkillCreate",
+    "SkillBulkCreate",
+    "SkillBulkCreateResult",
     "SkillUpdate",
     "Skill",
     "SkillSearchResult",
@@ -27,5 +31,13 @@ __all__ = [
     "SwapRequestResponse",
     "MySwapsResponse",
     "RatingCreate",
-    "RatingResponse"
+    "RatingResponse",
+    "SwapMatch",
+    "SwapCycleStep",
+    "SwapCycle",
+    "AdminUser",
+    "AdminSwap",
+    "AdminUserPage",
+    "AdminSkillPage",
+    "AdminSwapPage"
 ]
\ No newline at end of file
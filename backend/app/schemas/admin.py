@@ -0,0 +1,40 @@
+from pydantic import BaseModel
+from typing import Optional, List
+from datetime import datetime
+from ..models.swap import SwapStatus
+from .skill import Skill
+
+class AdminUser(BaseModel):
+    id: int
+    name: str
+    email: str
+    avatar_url: Optional[str] = None
+    is_public: bool
+    is_banned: bool
+    is_admin: bool
+    availability: str
+    created_at: datetime
+    offered_skill_count: int
+
+class AdminSwap(BaseModel):
+    id: int
+    requester_id: int
+    requester_name: str
+    responder_id: int
+    responder_name: str
+    offered_skill: str
+    wanted_skill: str
+    status: SwapStatus
+    created_at: datetime
+
+class AdminUserPage(BaseModel):
+    items: List[AdminUser]
+    next_cursor: Optional[str] = None
+
+class AdminSkillPage(BaseModel):
+    items: List[Skill]
+    next_cursor: Optional[str] = None
+
+class AdminSwapPage(BaseModel):
+    items: List[AdminSwap]
+    next_cursor: Optional[str] = None
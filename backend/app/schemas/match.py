@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+from typing import List
+from .user import UserSearch
+
+class SwapMatch(BaseModel):
+    user: UserSearch
+    offered_skill_ids: List[int]
+    wanted_skill_ids: List[int]
+    overlap: int
+
+class SwapCycleStep(BaseModel):
+    teacher_id: int
+    learner_id: int
+    skill_ids: List[int]
+
+class SwapCycle(BaseModel):
+    users: List[UserSearch]
+    steps: List[SwapCycleStep]
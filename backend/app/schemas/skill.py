@@ -1,5 +1,5 @@
 from pydantic import BaseModel, validator
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 class SkillBase(BaseModel):
@@ -20,6 +20,21 @@ class SkillCreate(BaseModel):
             raise ValueError('Skill name must be at least 2 characters')
         return v.strip().title()
 
+class SkillBulkCreate(BaseModel):
+    skills: List[SkillCreate]
+    
+    @validator('skills')
+    def validate_skills(cls, v):
+        if not v:
+            raise ValueError('At least one skill is required')
+        if len(v) > 100:
+            raise ValueError('At most 100 skills can be created at once')
+        return v
+
+class SkillBulkCreateResult(BaseModel):
+    created: List[SkillBase]
+    existing: List[SkillBase]
+
 class SkillUpdate(BaseModel):
     name: Optional[str] = None
     description: Optional[str] = None
@@ -34,7 +49,9 @@ class Skill(SkillBase):
 
 class SkillSearchResult(BaseModel):
     skills: list[SkillBase]
-    total: int
+    total: Optional[int] = None
+    total_capped: bool = False
     page: int
     per_page: int
-    has_more: bool
\ No newline at end of file
+    has_more: bool
+    next_cursor: Optional[str] = None
\ No newline at end of file
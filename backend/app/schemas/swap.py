@@ -1,5 +1,5 @@
 from pydantic import BaseModel, validator
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 from ..models.swap import SwapStatus
 from .skill import SkillBase
@@ -40,4 +40,6 @@ class MySwapsResponse(BaseModel):
     pending: List[SwapRequestResponse]
     accepted: List[SwapRequestResponse]
     completed: List[SwapRequestResponse]
-    history: List[SwapRequestResponse]
\ No newline at end of file
+    history: List[SwapRequestResponse]
+    counts: Dict[str, int] = {}
+    next_cursors: Dict[str, Optional[str]] = {}
\ No newline at end of file
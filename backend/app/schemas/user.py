@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, validator
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from .skill import SkillBase
 
@@ -39,6 +39,9 @@ class UserPublic(BaseModel):
     availability: str
     offered_skills: List[SkillBase] = []
     wanted_skills: List[SkillBase] = []
+    rating_count: int = 0
+    average_rating: Optional[float] = None
+    rating_histogram: Dict[int, int] = {}
     
     class Config:
         from_attributes = True
@@ -51,6 +54,9 @@ class UserSearch(BaseModel):
     availability: str
     offered_skills: List[SkillBase] = []
     wanted_skills: List[SkillBase] = []
+    rating_count: int = 0
+    average_rating: Optional[float] = None
+    rating_histogram: Dict[int, int] = {}
     
     class Config:
         from_attributes = True
\ No newline at end of file
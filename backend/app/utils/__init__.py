@@ -1,9 +1,19 @@
-from .helpers import is_admin_email, paginate_query, calculate_pagination_info, validate_skills_exist, get_user_average_rating
+from .helpers import is_admin_email, user_skill_options, paginate_query, calculate_pagination_info, encode_cursor, decode_cursor, validate_skills_exist, find_missing_skill_ids, replace_user_skills, get_user_average_rating
+from .search import UserSearchBackend, LikeUserSearch, PostgresUserSearch, get_user_search_backend
 
 __all__ = [
     "is_admin_email",
+    "user_skill_options",
     "paginate_query", 
     "calculate_pagination_info",
+    "encode_cursor",
+    "decode_cursor",
     "validate_skills_exist",
-    "get_user_average_rating"
+    "find_missing_skill_ids",
+    "replace_user_skills",
+    "get_user_average_rating",
+    "UserSearchBackend",
+    "LikeUserSearch",
+    "PostgresUserSearch",
+    "get_user_search_backend"
 ]
\ No newline at end of file
@@ -1,11 +1,22 @@
-from typing import Optional, List
-from sqlalchemy.orm import Session
+import base64
+import binascii
+import json
+from typing import Any, Callable, Optional, List, Iterable
+from sqlalchemy import select, func, insert, delete, Table
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from ..models import User, Skill
 
 def is_admin_email(email: str) -> bool:
     from ..config import settings
     return any(domain in email for domain in settings.ADMIN_EMAIL_DOMAINS)
 
+def user_skill_options():
+    return (
+        selectinload(User.offered_skills),
+        selectinload(User.wanted_skills)
+    )
+
 def paginate_query(query, page: int = 1, per_page: int = 10):
     offset = (page - 1) * per_page
     return query.offset(offset).limit(per_page)
@@ -24,19 +35,64 @@ def calculate_pagination_info(total: int, page: int, per_page: int) -> dict:
         "has_prev": has_prev
     }
 
-def validate_skills_exist(db: Session, skill_ids: List[int]) -> bool:
+def encode_cursor(*values) -> str:
+    raw = json.dumps(list(values), separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor: str, *converters: Callable[[Any], Any]) -> list:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError):
+        raise ValueError("Invalid cursor")
+    
+    if not isinstance(values, list) or len(values) != len(converters):
+        raise ValueError("Invalid cursor")
+    if any(isinstance(value, (list, dict, bool)) or value is None for value in values):
+        raise ValueError("Invalid cursor")
+    try:
+        return [convert(value) for convert, value in zip(converters, values)]
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError("Invalid cursor")
+
+async def validate_skills_exist(db: AsyncSession, skill_ids: List[int]) -> bool:
     if not skill_ids:
         return True
     
-    existing_skills = db.query(Skill).filter(Skill.id.in_(skill_ids)).count()
+    existing_skills = await db.scalar(
+        select(func.count()).select_from(Skill).where(Skill.id.in_(skill_ids))
+    )
     return existing_skills == len(skill_ids)
 
-def get_user_average_rating(db: Session, user_id: int) -> Optional[float]:
-    from ..models import Rating
+async def find_missing_skill_ids(db: AsyncSession, skill_ids: Iterable[int]) -> List[int]:
+    requested = set(skill_ids)
+    if not requested:
+        return []
     
-    ratings = db.query(Rating).filter(Rating.rated_id == user_id).all()
-    if not ratings:
-        return None
+    existing = await db.scalars(select(Skill.id).where(Skill.id.in_(requested)))
+    return sorted(requested - set(existing))
+
+async def replace_user_skills(db: AsyncSession, association: Table, user_id: int, skill_ids: Iterable[int]):
+    requested = set(skill_ids)
+    current = set(await db.scalars(
+        select(association.c.skill_id).where(association.c.user_id == user_id)
+    ))
+    
+    removed = current - requested
+    if removed:
+        await db.execute(
+            delete(association).where(
+                association.c.user_id == user_id,
+                association.c.skill_id.in_(removed)
+            )
+        )
     
-    total_stars = sum(rating.stars for rating in ratings)
-    return total_stars / len(ratings)
\ No newline at end of file
+    added = requested - current
+    if added:
+        await db.execute(
+            insert(association),
+            [{"user_id": user_id, "skill_id": skill_id} for skill_id in sorted(added)]
+        )
+
+async def get_user_average_rating(db: AsyncSession, user_id: int) -> Optional[float]:
+    user = await db.get(User, user_id)
+    return user.average_rating if user else None
@@ -0,0 +1,83 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Optional, List, Tuple
+from sqlalchemy import text, func, or_
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
+from ..config import settings
+from ..models import User, Skill
+
+USER_SEARCH_VECTOR_SQL = """
+UPDATE users SET search_vector =
+    setweight(to_tsvector('simple', coalesce(users.name, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce((
+        SELECT string_agg(skills.name, ' ')
+        FROM skills_offered JOIN skills ON skills.id = skills_offered.skill_id
+        WHERE skills_offered.user_id = users.id
+    ), '')), 'B') ||
+    setweight(to_tsvector('simple', coalesce(users.bio, '')), 'C')
+"""
+
+class UserSearchBackend(ABC):
+    name = "base"
+
+    @abstractmethod
+    def search(self, query: Select, q: str) -> Tuple[Select, Optional[ColumnElement]]:
+        ...
+
+    def filter_offered_skill(self, query: Select, skill: str) -> Select:
+        return query.where(User.offered_skills.any(Skill.name.ilike(f"%{skill}%")))
+
+    async def refresh_vectors(self, db, user_ids: Optional[List[int]] = None):
+        pass
+
+class LikeUserSearch(UserSearchBackend):
+    name = "like"
+
+    def search(self, query: Select, q: str) -> Tuple[Select, Optional[ColumnElement]]:
+        search_term = f"%{q}%"
+        return query.where(
+            or_(
+                User.name.ilike(search_term),
+                User.bio.ilike(search_term),
+                User.offered_skills.any(Skill.name.ilike(search_term))
+            )
+        ), None
+
+class PostgresUserSearch(UserSearchBackend):
+    name = "postgres"
+
+    def search(self, query: Select, q: str) -> Tuple[Select, Optional[ColumnElement]]:
+        name_similarity = func.similarity(User.name, q)
+        terms = re.findall(r"[^\W_]+", q.lower())
+        if not terms:
+            return query.where(User.name.op("%")(q)), name_similarity
+
+        ts_query = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+        rank = func.ts_rank(User.search_vector, ts_query) + name_similarity
+        return query.where(
+            or_(
+                User.search_vector.op("@@")(ts_query),
+                User.name.op("%")(q)
+            )
+        ), rank
+
+    async def refresh_vectors(self, db, user_ids: Optional[List[int]] = None):
+        if user_ids is None:
+            await db.execute(text(USER_SEARCH_VECTOR_SQL))
+        elif user_ids:
+            await db.execute(
+                text(USER_SEARCH_VECTOR_SQL + " WHERE users.id = ANY(:user_ids)"),
+                {"user_ids": list(user_ids)}
+            )
+
+USER_SEARCH_BACKENDS = {
+    "like": LikeUserSearch(),
+    "postgres": PostgresUserSearch()
+}
+
+def get_user_search_backend(db) -> UserSearchBackend:
+    backend = settings.USER_SEARCH_BACKEND
+    if backend == "auto":
+        backend = "postgres" if db.get_bind().dialect.name == "postgresql" else "like"
+    return USER_SEARCH_BACKENDS[backend]
@@ -0,0 +1,115 @@
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from app.core.responses import FastJSONResponse, orjson
+from app.models import SwapStatus
+from app.schemas import SkillBase, UserSearch, SwapRequestResponse, MySwapsResponse, RatingResponse
+
+REQUESTS = int(os.environ.get("BENCH_REQUESTS", "500"))
+PAGE_SIZE = int(os.environ.get("BENCH_PAGE_SIZE", "50"))
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+def skills(n: int) -> list:
+    return [SkillBase(id=n * 10 + j, name=f"Skill {n}-{j}", description="A useful skill") for j in range(3)]
+
+def search_page() -> list:
+    return [
+        UserSearch(
+            id=i,
+            name=f"User {i}",
+            bio="Happy to swap lessons on weekends.",
+            availability="available",
+            offered_skills=skills(i),
+            wanted_skills=skills(i + 1),
+            rating_count=12,
+            average_rating=4.25,
+            rating_histogram={1: 0, 2: 1, 3: 1, 4: 4, 5: 6}
+        )
+        for i in range(PAGE_SIZE)
+    ]
+
+def swap(i: int, status: SwapStatus) -> SwapRequestResponse:
+    return SwapRequestResponse(
+        id=i,
+        requester_id=1,
+        responder_id=2,
+        requester_name="Alice",
+        responder_name="Bob",
+        offered_skill=skills(i)[0],
+        wanted_skill=skills(i)[1],
+        status=status,
+        message="Would love to trade!",
+        created_at=START + timedelta(minutes=i)
+    )
+
+def my_swaps() -> MySwapsResponse:
+    per_bucket = PAGE_SIZE // 4
+    return MySwapsResponse(
+        pending=[swap(i, SwapStatus.PENDING) for i in range(per_bucket)],
+        accepted=[swap(i, SwapStatus.ACCEPTED) for i in range(per_bucket)],
+        completed=[swap(i, SwapStatus.COMPLETED) for i in range(per_bucket)],
+        history=[swap(i, SwapStatus.REJECTED) for i in range(per_bucket)],
+        counts={"pending": per_bucket, "accepted": per_bucket, "completed": per_bucket, "history": per_bucket},
+        next_cursors={"pending": None, "accepted": None, "completed": None, "history": None}
+    )
+
+def user_ratings() -> list:
+    return [
+        RatingResponse(
+            id=i,
+            swap_id=i,
+            rater_id=i,
+            rated_id=1,
+            rater_name=f"User {i}",
+            rated_name="Alice",
+            stars=i % 5 + 1,
+            comment="Great teacher",
+            created_at=START + timedelta(hours=i)
+        )
+        for i in range(PAGE_SIZE)
+    ]
+
+async def default_path(field, content):
+    body = await serialize_response(field=field, response_content=content)
+    return JSONResponse(body)
+
+async def fast_path(field, content):
+    return FastJSONResponse(content)
+
+async def cpu_per_request(render, field, content) -> float:
+    for _ in range(20):
+        await render(field, content)
+    start = time.process_time()
+    for _ in range(REQUESTS):
+        await render(field, content)
+    return (time.process_time() - start) / REQUESTS
+
+async def main():
+    endpoints = {
+        "GET /api/users/": (List[UserSearch], search_page()),
+        "GET /api/swaps/my": (MySwapsResponse, my_swaps()),
+        "GET /api/ratings/user/{id}": (List[RatingResponse], user_ratings()),
+    }
+
+    print(f"{PAGE_SIZE} items per page, {REQUESTS} requests, orjson {'available' if orjson else 'missing'}")
+    for name, (response_model, content) in endpoints.items():
+        field = create_response_field(name="Response", type_=response_model)
+        default = await cpu_per_request(default_path, field, content)
+        fast = await cpu_per_request(fast_path, field, content)
+        print(
+            f"{name:<28} default {default * 1e6:8.1f} us  fast {fast * 1e6:8.1f} us"
+            f"  ({default / fast:.1f}x)"
+        )
+
+if __name__ == "__main__":
+    asyncio.run(main())
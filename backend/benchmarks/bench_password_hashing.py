@@ -0,0 +1,64 @@
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.security import PasswordHashPool, pwd_context
+
+LOGINS = int(os.environ.get("BENCH_LOGINS", "48"))
+HASHED = pwd_context.hash("password123")
+
+def verify():
+    return pwd_context.verify("password123", HASHED)
+
+async def measure_loop_lag(stop: asyncio.Event) -> float:
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.005)
+        worst = max(worst, time.perf_counter() - start - 0.005)
+    return worst
+
+async def run_inline() -> tuple:
+    async def login():
+        return verify()
+
+    return await run_logins(login)
+
+async def run_pool(workers: int) -> tuple:
+    pool = PasswordHashPool(max_workers=workers, max_pending=LOGINS)
+
+    async def login():
+        return await pool.run(verify)
+
+    try:
+        return await run_logins(login)
+    finally:
+        pool.executor.shutdown()
+
+async def run_logins(login) -> tuple:
+    stop = asyncio.Event()
+    lag = asyncio.create_task(measure_loop_lag(stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(LOGINS)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    return LOGINS / elapsed, await lag
+
+async def main():
+    cores = os.cpu_count() or 1
+    print(f"bcrypt rounds={pwd_context.to_dict()['bcrypt__rounds']} logins={LOGINS} cores={cores}")
+
+    throughput, lag = await run_inline()
+    print(f"{'inline':<12} {throughput:8.1f} logins/s  worst loop stall {lag * 1000:8.1f} ms")
+
+    workers = 1
+    while workers <= cores:
+        throughput, lag = await run_pool(workers)
+        print(f"{f'pool x{workers}':<12} {throughput:8.1f} logins/s  worst loop stall {lag * 1000:8.1f} ms")
+        workers *= 2
+
+if __name__ == "__main__":
+    asyncio.run(main())
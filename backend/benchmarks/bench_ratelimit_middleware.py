@@ -0,0 +1,87 @@
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from app.core import RateLimitMiddleware, InMemoryRateLimiter
+
+REQUESTS = 20000
+LIMIT = 10 ** 9
+
+class BaseHTTPRateLimitMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app, limiter):
+        super().__init__(app)
+        self.limiter = limiter
+
+    async def dispatch(self, request, call_next):
+        if not await self.limiter.hit(request.client.host, LIMIT, 1):
+            return PlainTextResponse("Rate limit exceeded", status_code=429)
+        return await call_next(request)
+
+async def ok(request):
+    return PlainTextResponse("ok")
+
+def build_app(*middleware):
+    return Starlette(routes=[Route("/api/skills/", ok)], middleware=list(middleware))
+
+async def run(app, requests: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/skills/",
+        "raw_path": b"/api/skills/",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("10.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        received = []
+
+        async def receive():
+            if received:
+                await asyncio.Event().wait()
+            received.append(True)
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        await app(dict(scope), receive, send)
+    return time.perf_counter() - start
+
+async def main():
+    apps = {
+        "no middleware": build_app(),
+        "BaseHTTPMiddleware": build_app(Middleware(BaseHTTPRateLimitMiddleware, limiter=InMemoryRateLimiter())),
+        "pure ASGI": build_app(Middleware(RateLimitMiddleware, limiter=InMemoryRateLimiter(), policies={"/api/auth/login": [LIMIT, 60]})),
+    }
+
+    for app in apps.values():
+        await run(app, 500)
+
+    baseline = None
+    for name, app in apps.items():
+        elapsed = await run(app, REQUESTS)
+        per_request = elapsed / REQUESTS * 1e6
+        if baseline is None:
+            baseline = per_request
+            print(f"{name:<20} {per_request:8.1f} us/request")
+        else:
+            print(f"{name:<20} {per_request:8.1f} us/request  (+{per_request - baseline:.1f} us overhead)")
+
+if __name__ == "__main__":
+    asyncio.run(main())
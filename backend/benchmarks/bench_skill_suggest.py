@@ -0,0 +1,95 @@
+import asyncio
+import os
+import random
+import statistics
+import string
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.autocomplete import SkillSuggester
+
+SKILLS = int(os.environ.get("BENCH_SKILLS", "5000"))
+QUERIES = int(os.environ.get("BENCH_QUERIES", "2000"))
+DATABASE_URL = os.environ.get("BENCH_DATABASE_URL")
+
+WORDS = [
+    "python", "guitar", "spanish", "cooking", "pottery", "design", "piano", "photography",
+    "javascript", "yoga", "painting", "french", "baking", "writing", "drawing", "marketing"
+]
+
+def skill_names(rng: random.Random) -> list:
+    names = set()
+    while len(names) < SKILLS:
+        words = rng.sample(WORDS, rng.randint(1, 2))
+        suffix = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(0, 4)))
+        names.add(" ".join(words + ([suffix] if suffix else [])).title())
+    return sorted(names)
+
+def keystrokes(rng: random.Random, names: list) -> list:
+    queries = []
+    for _ in range(QUERIES):
+        name = rng.choice(names).lower()
+        queries.append(name[:rng.randint(1, min(len(name), 8))])
+    return queries
+
+def report(label: str, timings: list):
+    timings.sort()
+    print(
+        f"{label:<10} p50 {statistics.median(timings) * 1e6:9.1f} us"
+        f"  p95 {timings[int(len(timings) * 0.95)] * 1e6:9.1f} us"
+    )
+
+def bench_memory(names: list, queries: list):
+    suggester = SkillSuggester()
+    start = time.perf_counter()
+    for skill_id, name in enumerate(names, 1):
+        suggester.add(skill_id, name)
+    print(f"index build {(time.perf_counter() - start) * 1000:8.1f} ms for {len(names)} skills")
+
+    timings = []
+    for q in queries:
+        start = time.perf_counter()
+        suggester.suggest(q, 10)
+        timings.append(time.perf_counter() - start)
+    report("in-memory", timings)
+
+async def bench_sql(names: list, queries: list):
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from app.database import get_async_database_url
+
+    engine = create_async_engine(get_async_database_url(DATABASE_URL))
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.execute(text("CREATE TEMP TABLE bench_skills (id serial PRIMARY KEY, name text)"))
+        await conn.execute(text("INSERT INTO bench_skills (name) SELECT unnest(CAST(:names AS text[]))"), {"names": names})
+        await conn.execute(text("CREATE INDEX ON bench_skills USING gin (name gin_trgm_ops)"))
+        await conn.execute(text("ANALYZE bench_skills"))
+        await conn.execute(text("SELECT set_config('pg_trgm.similarity_threshold', '0.1', false)"))
+
+        timings = []
+        for q in queries:
+            start = time.perf_counter()
+            await conn.execute(
+                text("SELECT id, name FROM bench_skills WHERE name % :q ORDER BY similarity(name, :q) DESC, id LIMIT 10"),
+                {"q": q}
+            )
+            timings.append(time.perf_counter() - start)
+        report("postgres", timings)
+    await engine.dispose()
+
+def main():
+    rng = random.Random(7)
+    names = skill_names(rng)
+    queries = keystrokes(rng, names)
+    print(f"skills={len(names)} queries={len(queries)}")
+    bench_memory(names, queries)
+    if DATABASE_URL:
+        asyncio.run(bench_sql(names, queries))
+    else:
+        print("postgres   skipped (set BENCH_DATABASE_URL to compare against the SQL path)")
+
+if __name__ == "__main__":
+    main()
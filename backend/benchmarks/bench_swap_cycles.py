@@ -0,0 +1,61 @@
+import itertools
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.matching import MatchIndex
+from app.core.cycles import SwapCycleFinder
+
+USERS = int(os.environ.get("BENCH_USERS", "100000"))
+SKILLS = int(os.environ.get("BENCH_SKILLS", "2000"))
+SKILLS_PER_USER = int(os.environ.get("BENCH_SKILLS_PER_USER", "3"))
+QUERIES = int(os.environ.get("BENCH_QUERIES", "200"))
+BRANCHING = int(os.environ.get("BENCH_BRANCHING", "200"))
+
+def skill_sample(rng: random.Random, cum_weights: list) -> set:
+    return set(rng.choices(range(SKILLS), cum_weights=cum_weights, k=SKILLS_PER_USER))
+
+def build_index(rng: random.Random) -> MatchIndex:
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(SKILLS)))
+    index = MatchIndex()
+    for user_id in range(1, USERS + 1):
+        index.set_user(
+            user_id,
+            skill_sample(rng, cum_weights),
+            skill_sample(rng, cum_weights),
+            availability=rng.choice(["available", "busy", "unavailable"]),
+            average_rating=rng.choice([None, 3.0, 4.0, 5.0])
+        )
+    index.loaded_at = 0.0
+    return index
+
+def main():
+    rng = random.Random(42)
+    start = time.perf_counter()
+    index = build_index(rng)
+    print(f"users={USERS} skills={SKILLS} skills/user={SKILLS_PER_USER} branching={BRANCHING}")
+    print(f"index build {time.perf_counter() - start:8.2f} s")
+
+    finder = SwapCycleFinder(index, max_branching=BRANCHING)
+    sample = rng.sample(range(1, USERS + 1), QUERIES)
+    for max_length in (2, 3, 4):
+        timings = []
+        found = 0
+        for user_id in sample:
+            start = time.perf_counter()
+            cycles = finder.find(user_id, max_length=max_length)
+            timings.append(time.perf_counter() - start)
+            found += bool(cycles)
+        timings.sort()
+        print(
+            f"length<={max_length}  p50 {statistics.median(timings) * 1000:7.2f} ms"
+            f"  p95 {timings[int(len(timings) * 0.95)] * 1000:7.2f} ms"
+            f"  users with a cycle {found / QUERIES:6.1%}"
+        )
+
+if __name__ == "__main__":
+    main()
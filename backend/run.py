@@ -1,33 +1,40 @@
 import uvicorn
+import asyncio
 import os
 import subprocess
 import sys
 from app.database import init_db, engine
+from app.utils import PostgresUserSearch
 from sqlalchemy import text
 
+async def seed_database():
+    await init_db()
+    
+    async with engine.connect() as conn:
+        result = await conn.execute(text("SELECT COUNT(*) FROM users"))
+        user_count = result.fetchone()[0]
+        
+        if user_count == 0:
+            print("Seeding database with initial data...")
+            with open("seed.sql", "r") as f:
+                sql_commands = f.read()
+            
+            for command in sql_commands.split(';'):
+                command = command.strip()
+                if command:
+                    await conn.execute(text(command))
+            await PostgresUserSearch().refresh_vectors(conn)
+            await conn.commit()
+            print("Database seeded successfully!")
+        else:
+            print("Database already contains data, skipping seed.")
+    
+    await engine.dispose()
+
 def setup_database():
     print("Setting up database...")
     try:
-        init_db()
-        
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT COUNT(*) FROM users"))
-            user_count = result.fetchone()[0]
-            
-            if user_count == 0:
-                print("Seeding database with initial data...")
-                with open("seed.sql", "r") as f:
-                    sql_commands = f.read()
-                
-                for command in sql_commands.split(';'):
-                    command = command.strip()
-                    if command:
-                        conn.execute(text(command))
-                conn.commit()
-                print("Database seeded successfully!")
-            else:
-                print("Database already contains data, skipping seed.")
-                
+        asyncio.run(seed_database())
     except Exception as e:
         print(f"Database setup error: {e}")
         sys.exit(1)
@@ -1,15 +1,29 @@
+import os
+
+os.environ.setdefault("RATE_LIMIT_REQUESTS", "10000")
+os.environ.setdefault("RATE_LIMIT_POLICIES", "{}")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
 from app.main import app
-from app.database import get_db, Base
+from app.database import get_db, get_sessionmaker, Base
 from app.models import User, Skill
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash, create_access_token
+from app.core.cache import user_cache
+from app.core.matching import match_index
+from app.core.cycles import cycle_cache
+from app.core.events import event_dispatcher
+from app.core.catalogue import skill_catalogue
+from app.core.autocomplete import skill_suggester
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+ASYNC_SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -18,34 +32,81 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# TestClient runs every request on a fresh event loop, so pooled aiosqlite
+# connections must not outlive a request.
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+AsyncTestingSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 @pytest.fixture(scope="session")
 def db():
+    Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
 
 @pytest.fixture(scope="function")
 def db_session(db):
-    connection = engine.connect()
-    transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
+    session = TestingSessionLocal()
     yield session
+    session.rollback()
+    for table in reversed(Base.metadata.sorted_tables):
+        session.execute(table.delete())
+    session.commit()
     session.close()
-    transaction.rollback()
-    connection.close()
 
 @pytest.fixture(scope="function")
 def client(db_session):
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
-    
+    async def override_get_db():
+        async with AsyncTestingSessionLocal() as session:
+            yield session
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_sessionmaker] = lambda: AsyncTestingSessionLocal
+    user_cache.clear()
+    match_index.clear()
+    cycle_cache.clear()
+    event_dispatcher.clear()
+    skill_catalogue.invalidate()
+    skill_suggester.clear()
     yield TestClient(app)
     app.dependency_overrides.clear()
 
+@pytest.fixture
+def session_factory(db_session):
+    return AsyncTestingSessionLocal
+
+@pytest.fixture
+def query_counter():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+@pytest.fixture
+def open_connections():
+    counter = {"open": 0}
+
+    def checkout(dbapi_connection, connection_record, connection_proxy):
+        counter["open"] += 1
+
+    def checkin(dbapi_connection, connection_record):
+        counter["open"] -= 1
+
+    event.listen(async_engine.sync_engine, "checkout", checkout)
+    event.listen(async_engine.sync_engine, "checkin", checkin)
+    yield counter
+    event.remove(async_engine.sync_engine, "checkout", checkout)
+    event.remove(async_engine.sync_engine, "checkin", checkin)
+
 @pytest.fixture
 def test_user(db_session):
     user = User(
@@ -72,6 +133,13 @@ def test_skill(db_session):
     db_session.refresh(skill)
     return skill
 
+@pytest.fixture
+def login_as():
+    def login(client: TestClient, user: User) -> TestClient:
+        client.cookies.set("access_token", create_access_token(data={"sub": str(user.id)}))
+        return client
+    return login
+
 @pytest.fixture
 def auth_headers(client, test_user):
     response = client.post(
@@ -93,4 +161,30 @@ def admin_user(db_session):
     db_session.add(user)
     db_session.commit()
     db_session.refresh(user)
-    return user
\ No newline at end of file
+    return user
+
+@pytest.fixture
+def add_users_with_skills(db_session):
+    created = []
+
+    def add(count, skills_per_user=2):
+        users = []
+        for _ in range(count):
+            n = len(created)
+            user = User(
+                name=f"Loaded User {n}",
+                email=f"loaded-{n}@example.com",
+                password_hash="not-used",
+                is_public=True,
+                availability="available"
+            )
+            for j in range(skills_per_user):
+                user.offered_skills.append(Skill(name=f"Offered {n}-{j}"))
+                user.wanted_skills.append(Skill(name=f"Wanted {n}-{j}"))
+            created.append(user)
+            users.append(user)
+        db_session.add_all(users)
+        db_session.commit()
+        return users
+
+    return add
@@ -0,0 +1,163 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.utils import encode_cursor
+
+@pytest.fixture
+def admin_client(client: TestClient, admin_user, login_as):
+    login_as(client, admin_user)
+    return client
+
+def test_get_all_users_query_count_is_constant(admin_client: TestClient, add_users_with_skills, query_counter):
+    add_users_with_skills(1)
+    admin_client.get("/api/admin/users")
+    query_counter.clear()
+    response = admin_client.get("/api/admin/users")
+    assert response.status_code == 200
+    single_user_queries = len(query_counter)
+
+    add_users_with_skills(6)
+    query_counter.clear()
+    response = admin_client.get("/api/admin/users")
+    assert response.status_code == 200
+
+    assert len(response.json()["items"]) == 8
+    assert len(query_counter) == single_user_queries == 1
+
+def test_admin_users_are_projected_and_cursor_paginated(admin_client: TestClient, add_users_with_skills):
+    add_users_with_skills(4, skills_per_user=3)
+
+    response = admin_client.get("/api/admin/users", params={"limit": 3})
+    assert response.status_code == 200
+    first_page = response.json()
+    assert len(first_page["items"]) == 3
+    assert first_page["items"][1]["offered_skill_count"] == 3
+    assert "password_hash" not in first_page["items"][0]
+    assert "offered_skills" not in first_page["items"][0]
+
+    response = admin_client.get("/api/admin/users", params={"limit": 3, "cursor": first_page["next_cursor"]})
+    second_page = response.json()
+    assert len(second_page["items"]) == 2
+    assert second_page["next_cursor"] is None
+    ids = [user["id"] for user in first_page["items"] + second_page["items"]]
+    assert ids == sorted(set(ids))
+
+    assert admin_client.get("/api/admin/users", params={"cursor": "bogus"}).status_code == 400
+    for values in [([1],), ({"x": 1},), ("abc",), (None,)]:
+        assert admin_client.get("/api/admin/users", params={"cursor": encode_cursor(*values)}).status_code == 400
+
+def test_admin_users_tolerate_null_flags(admin_client: TestClient, db_session, add_users_with_skills):
+    from sqlalchemy import text
+
+    (alice,) = add_users_with_skills(1)
+    db_session.execute(
+        text("UPDATE users SET is_public = NULL, is_banned = NULL, is_admin = NULL, availability = NULL WHERE id = :id"),
+        {"id": alice.id}
+    )
+    db_session.commit()
+
+    response = admin_client.get("/api/admin/users")
+    assert response.status_code == 200
+    user = next(user for user in response.json()["items"] if user["id"] == alice.id)
+    assert (user["is_public"], user["is_banned"], user["is_admin"]) == (True, False, False)
+    assert user["availability"] == "available"
+
+    active = admin_client.get("/api/admin/users", params={"banned": False}).json()["items"]
+    assert alice.id in [user["id"] for user in active]
+
+def test_admin_list_filters(admin_client: TestClient, db_session, add_users_with_skills):
+    from datetime import datetime, timedelta
+    from app.models import SwapRequest, SwapStatus
+
+    alice, bob = add_users_with_skills(2)
+    bob.is_banned = True
+    alice.offered_skills[0].is_approved = False
+    old = datetime(2024, 1, 1)
+    for swap_status, created_at in [
+        (SwapStatus.PENDING, old),
+        (SwapStatus.ACCEPTED, old + timedelta(days=10)),
+        (SwapStatus.ACCEPTED, old + timedelta(days=20))
+    ]:
+        db_session.add(SwapRequest(
+            requester_id=alice.id,
+            responder_id=bob.id,
+            offered_skill_id=alice.offered_skills[0].id,
+            wanted_skill_id=bob.offered_skills[0].id,
+            status=swap_status,
+            created_at=created_at
+        ))
+    db_session.commit()
+
+    banned = admin_client.get("/api/admin/users", params={"banned": True}).json()["items"]
+    assert [user["id"] for user in banned] == [bob.id]
+
+    pending = admin_client.get("/api/admin/skills", params={"approved": False}).json()["items"]
+    assert [skill["name"] for skill in pending] == [alice.offered_skills[0].name]
+
+    swaps = admin_client.get("/api/admin/swaps", params={"status": "accepted"}).json()["items"]
+    assert len(swaps) == 2
+    assert swaps[0]["requester_name"] == alice.name
+    assert swaps[0]["wanted_skill"] == bob.offered_skills[0].name
+
+    swaps = admin_client.get("/api/admin/swaps", params={
+        "created_after": (old + timedelta(days=5)).isoformat(),
+        "created_before": (old + timedelta(days=15)).isoformat()
+    }).json()["items"]
+    assert [swap["created_at"][:10] for swap in swaps] == ["2024-01-11"]
+
+def test_admin_endpoints_require_admin(client: TestClient, test_user, login_as):
+    login_as(client, test_user)
+    assert client.get("/api/admin/users").status_code == 403
+    assert client.get("/api/admin/db/pool").status_code == 403
+
+def test_ban_invalidates_cached_user(admin_client: TestClient, test_user, login_as):
+    user_client = TestClient(admin_client.app)
+    login_as(user_client, test_user)
+    assert user_client.get("/api/users/me").status_code == 200
+
+    assert admin_client.put(f"/api/admin/users/{test_user.id}/ban").status_code == 200
+    assert user_client.get("/api/users/me").status_code == 401
+
+    assert admin_client.put(f"/api/admin/users/{test_user.id}/unban").status_code == 200
+    assert user_client.get("/api/users/me").status_code == 200
+
+def test_stats_csv_streams_users_and_swaps(admin_client: TestClient, db_session, add_users_with_skills, query_counter, monkeypatch):
+    import csv
+    import io
+    from app.models import SwapRequest, SwapStatus
+
+    monkeypatch.setattr("app.api.admin.CSV_BATCH_SIZE", 2)
+    alice, bob = add_users_with_skills(2)
+    for _ in range(3):
+        db_session.add(SwapRequest(
+            requester_id=alice.id,
+            responder_id=bob.id,
+            offered_skill_id=alice.offered_skills[0].id,
+            wanted_skill_id=bob.offered_skills[0].id,
+            status=SwapStatus.ACCEPTED
+        ))
+    db_session.commit()
+
+    admin_client.get("/api/admin/users")
+    query_counter.clear()
+    response = admin_client.get("/api/admin/stats/csv")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == ["Type", "ID", "Name", "Email", "Created_At", "Status", "Additional_Info"]
+    users = [row for row in rows if row[0] == "User"]
+    swaps = [row for row in rows if row[0] == "Swap"]
+    assert len(users) == 3
+    assert users[1][2:4] == [alice.name, alice.email]
+    assert users[1][5:] == ["Active", "Skills: 2"]
+    assert len(swaps) == 3
+    assert swaps[0][2] == f"{alice.name} -> {bob.name}"
+    assert swaps[0][5:] == ["accepted", f"{alice.offered_skills[0].name} for {bob.offered_skills[0].name}"]
+    assert len(query_counter) == 2
+
+def test_pool_metrics_reports_worker_pool(admin_client: TestClient):
+    response = admin_client.get("/api/admin/db/pool")
+    assert response.status_code == 200
+    metrics = response.json()
+    assert metrics["pool"] == "InstrumentedQueuePool"
+    assert {"pid", "checked_out", "overflow", "timeouts", "wait_avg_ms", "wait_max_ms"} <= set(metrics)
@@ -74,4 +74,42 @@ def test_logout(client: TestClient, test_user):
     
     logout_response = client.post("/api/auth/logout")
     assert logout_response.status_code == 200
-    assert logout_response.json()["message"] == "Logged out successfully"
\ No newline at end of file
+    assert logout_response.json()["message"] == "Logged out successfully"
+
+def test_login_returns_429_when_hash_pool_is_saturated(client: TestClient, test_user, monkeypatch):
+    from app.core.security import password_hash_pool
+    monkeypatch.setattr(password_hash_pool, "max_pending", 0)
+
+    response = client.post(
+        "/api/auth/login",
+        json={
+            "email": "test@example.com",
+            "password": "testpassword"
+        }
+    )
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+
+def test_password_hashing_runs_without_a_db_connection(client: TestClient, test_user, monkeypatch, open_connections):
+    from app.core import security
+    held = []
+
+    def tracking(hash_function):
+        async def wrapper(*args):
+            held.append(open_connections["open"])
+            return await hash_function(*args)
+        return wrapper
+
+    monkeypatch.setattr("app.api.auth.verify_password_async", tracking(security.verify_password_async))
+    monkeypatch.setattr("app.api.auth.get_password_hash_async", tracking(security.get_password_hash_async))
+
+    response = client.post("/api/auth/login", json={"email": "test@example.com", "password": "testpassword"})
+    assert response.status_code == 200
+    response = client.post("/api/auth/register", json={"name": "New User", "email": "new@example.com", "password": "password123"})
+    assert response.status_code == 200
+    assert held == [0, 0]
+
+def test_password_hash_uses_configured_rounds():
+    from app.core.security import get_password_hash
+    from app.config import settings
+    assert get_password_hash("password123").startswith(f"$2b${settings.BCRYPT_ROUNDS:02d}$")
@@ -0,0 +1,60 @@
+import asyncio
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.database import get_engine_options, get_pool_size, pool_metrics, pool_stats
+
+@pytest.fixture
+def db_settings(monkeypatch):
+    def configure(**values):
+        for name, value in values.items():
+            monkeypatch.setattr(f"app.database.settings.{name}", value)
+    return configure
+
+def test_pool_size_is_split_across_workers(db_settings):
+    db_settings(DB_POOL_SIZE=10, DB_MAX_OVERFLOW=5, DB_MAX_CONNECTIONS=None, WEB_CONCURRENCY=4)
+    assert get_pool_size() == (10, 5)
+
+    db_settings(DB_MAX_CONNECTIONS=40)
+    assert get_pool_size() == (10, 0)
+
+    db_settings(DB_MAX_CONNECTIONS=24)
+    assert get_pool_size() == (6, 0)
+
+def test_external_pooler_disables_client_side_pooling_and_statement_caches(db_settings):
+    db_settings(DB_EXTERNAL_POOLER=True)
+    options = get_engine_options("postgresql+asyncpg://user:pw@pgbouncer:6432/skillswap")
+
+    assert options["poolclass"].__name__ == "InstrumentedNullPool"
+    assert "pool_size" not in options
+    assert options["connect_args"]["statement_cache_size"] == 0
+    assert options["connect_args"]["prepared_statement_cache_size"] == 0
+    name_func = options["connect_args"]["prepared_statement_name_func"]
+    assert name_func() != name_func()
+
+def test_pool_metrics_track_checkouts_overflow_and_timeouts(db_settings, tmp_path):
+    db_settings(DB_EXTERNAL_POOLER=False, DB_POOL_SIZE=1, DB_MAX_OVERFLOW=1, DB_MAX_CONNECTIONS=None, DB_POOL_TIMEOUT=0.05)
+    url = f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}"
+    engine = create_async_engine(url, **get_engine_options(url))
+    pool_stats.reset()
+
+    async def scenario():
+        async with engine.connect() as first, engine.connect() as second:
+            await first.execute(text("SELECT 1"))
+            await second.execute(text("SELECT 1"))
+            busy = pool_metrics(engine)
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+        idle = pool_metrics(engine)
+        await engine.dispose()
+        return busy, idle
+
+    busy, idle = asyncio.run(scenario())
+    assert busy["checked_out"] == 2
+    assert busy["overflow"] == 1
+    assert busy["size"] == 1
+    assert idle["checked_out"] == 0
+    assert idle["checkouts"] == 2
+    assert idle["timeouts"] == 1
+    assert idle["wait_max_ms"] >= 0
@@ -0,0 +1,79 @@
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+from app.core import EventDispatcher, DomainEvent, event_dispatcher
+
+def test_dispatcher_batches_and_coalesces_events():
+    batches = []
+
+    async def sink(events):
+        batches.append(events)
+
+    async def scenario():
+        dispatcher = EventDispatcher(flush_interval=0.01, batch_size=2)
+        dispatcher.sink = sink
+        dispatcher.emit(DomainEvent(1, "swap_update", {"status": "accepted"}, key=7))
+        dispatcher.emit(DomainEvent(1, "new_request", {"id": 8}))
+        dispatcher.emit(DomainEvent(1, "new_request", {"id": 9}))
+        dispatcher.emit(DomainEvent(1, "swap_update", {"status": "completed"}, key=7))
+        assert batches == []
+        await asyncio.sleep(0.05)
+        await dispatcher.stop()
+
+    asyncio.run(scenario())
+    assert [[event.data for event in batch] for batch in batches] == [
+        [{"id": 8}, {"id": 9}],
+        [{"status": "completed"}]
+    ]
+
+def test_dispatcher_survives_sink_failures():
+    delivered = []
+
+    async def sink(events):
+        if not delivered:
+            delivered.append(None)
+            raise ConnectionError("bus down")
+        delivered.extend(events)
+
+    async def scenario():
+        dispatcher = EventDispatcher(flush_interval=0, batch_size=1)
+        dispatcher.sink = sink
+        dispatcher.emit(DomainEvent(1, "new_request", 1))
+        dispatcher.emit(DomainEvent(2, "new_request", 2))
+        await dispatcher.stop()
+
+    asyncio.run(scenario())
+    assert [event.user_id for event in delivered[1:]] == [2]
+
+def test_swap_and_rating_handlers_emit_events(client: TestClient, db_session, test_user, test_skill, monkeypatch, login_as):
+    monkeypatch.setattr(event_dispatcher, "flush_interval", 60)
+    from app.models import User, Skill
+    partner_skill = Skill(name="Partner Skill")
+    partner = User(name="Partner", email="partner@example.com", password_hash="x", is_public=True, availability="available")
+    partner.offered_skills.append(partner_skill)
+    test_user.offered_skills.append(test_skill)
+    db_session.add(partner)
+    db_session.commit()
+
+    login_as(client, test_user)
+    response = client.post("/api/swaps/", json={
+        "responder_id": partner.id,
+        "offered_skill_id": test_skill.id,
+        "wanted_skill_id": partner_skill.id
+    })
+    swap_id = response.json()["id"]
+
+    partner_client = TestClient(client.app)
+    login_as(partner_client, partner)
+    assert partner_client.put(f"/api/swaps/{swap_id}", json={"status": "accepted"}).status_code == 200
+    assert client.post("/api/ratings/", json={"swap_id": swap_id, "rated_id": partner.id, "stars": 4}).status_code == 200
+
+    events = list(event_dispatcher.pending.values())
+    assert [(event.user_id, event.type) for event in events] == [
+        (partner.id, "new_request"),
+        (test_user.id, "swap_update"),
+        (partner.id, "rating_received")
+    ]
+    assert events[0].data["requester_name"] == "Test User"
+    assert events[1].data["status"] == "accepted"
+    assert events[2].data["stars"] == 4
@@ -0,0 +1,142 @@
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+from app.models import User, Skill
+from app.core.matching import MatchIndex
+
+def test_match_index_ranks_reciprocal_matches():
+    index = MatchIndex()
+    index.set_user(1, offered={10, 11}, wanted={20, 21})
+    index.set_user(2, offered={20}, wanted={10}, average_rating=3.0)
+    index.set_user(3, offered={20, 21}, wanted={10, 11}, availability="busy")
+    index.set_user(4, offered={20}, wanted={10}, average_rating=5.0)
+    index.set_user(5, offered={20, 21}, wanted={99})
+    index.set_user(6, offered={21}, wanted={11}, searchable=False)
+
+    matches = index.matches(1)
+    assert [match.user_id for match in matches] == [3, 4, 2]
+    assert matches[0].offered_skill_ids == {20, 21}
+    assert matches[0].wanted_skill_ids == {10, 11}
+    assert matches[0].overlap == 4
+    assert [match.user_id for match in index.matches(1, limit=1)] == [3]
+
+    index.set_user(3, offered={21}, wanted={99})
+    index.discard(4)
+    assert [match.user_id for match in index.matches(1)] == [2]
+    assert 4 not in index.offered_by[20]
+    assert index.matches(42) == []
+
+def test_match_index_reloads_after_ttl():
+    now = [0.0]
+    index = MatchIndex(ttl=10, clock=lambda: now[0])
+    assert index.is_stale()
+    index.loaded_at = 0.0
+    now[0] = 9
+    assert not index.is_stale()
+    now[0] = 10
+    assert index.is_stale()
+
+def test_stale_match_index_is_rebuilt_in_the_background(db_session, session_factory):
+    guitar, spanish = Skill(name="Guitar"), Skill(name="Spanish")
+    me = User(name="Me", email="me@example.com", password_hash="x", is_public=True)
+    partner = User(name="Partner", email="partner@example.com", password_hash="x", is_public=True)
+    me.offered_skills.append(guitar)
+    me.wanted_skills.append(spanish)
+    db_session.add_all([me, partner])
+    db_session.commit()
+
+    async def scenario():
+        now = [0.0]
+        index = MatchIndex(ttl=10, clock=lambda: now[0])
+        await index.ensure_loaded(session_factory)
+        assert index.refresher is None
+        assert index.matches(me.id) == []
+
+        partner.offered_skills.append(spanish)
+        partner.wanted_skills.append(guitar)
+        db_session.commit()
+        now[0] = 10
+        users = index.users
+        await index.ensure_loaded(session_factory)
+        assert index.users is users and index.matches(me.id) == []
+
+        await asyncio.sleep(0)
+        assert index.pending == []
+        index.update_user(partner.id, average_rating=4.5)
+        await index.refresher
+        assert index.users is not users
+        assert [match.user_id for match in index.matches(me.id)] == [partner.id]
+        assert index.users[partner.id].average_rating == 4.5
+        assert not index.is_stale()
+        await index.stop()
+
+    asyncio.run(scenario())
+
+def test_matches_endpoint_tracks_profile_changes(client: TestClient, db_session, test_user, login_as):
+    guitar, spanish, cooking = Skill(name="Guitar"), Skill(name="Spanish"), Skill(name="Cooking")
+    partner = User(name="Partner", email="partner@example.com", password_hash="x", is_public=True, availability="available")
+    partner.offered_skills.append(spanish)
+    partner.wanted_skills.append(guitar)
+    test_user.offered_skills.append(guitar)
+    test_user.wanted_skills.append(spanish)
+    db_session.add_all([partner, cooking])
+    db_session.commit()
+
+    login_as(client, test_user)
+    response = client.get("/api/matches/")
+    assert response.status_code == 200
+    matches = response.json()
+    assert [match["user"]["id"] for match in matches] == [partner.id]
+    assert matches[0]["offered_skill_ids"] == [spanish.id]
+    assert matches[0]["wanted_skill_ids"] == [guitar.id]
+
+    partner_client = TestClient(client.app)
+    login_as(partner_client, partner)
+    assert partner_client.put("/api/users/me", json={"wanted_skill_ids": [cooking.id]}).status_code == 200
+    assert client.get("/api/matches/").json() == []
+
+    assert client.put("/api/users/me", json={"offered_skill_ids": [cooking.id]}).status_code == 200
+    assert [match["user"]["id"] for match in client.get("/api/matches/").json()] == [partner.id]
+
+def test_matches_require_authentication(client: TestClient):
+    assert client.get("/api/matches/").status_code == 401
+
+def test_cycle_finder_finds_short_cycles_through_user():
+    from app.core.cycles import SwapCycleFinder
+    index = MatchIndex()
+    index.set_user(1, offered={10}, wanted={30, 40})
+    index.set_user(2, offered={20}, wanted={10})
+    index.set_user(3, offered={30}, wanted={20})
+    index.set_user(4, offered={40}, wanted={30})
+    index.set_user(5, offered={40}, wanted={10})
+    index.set_user(6, offered={30}, wanted={20}, searchable=False)
+
+    cycles = SwapCycleFinder(index).find(1)
+    assert [cycle.user_ids for cycle in cycles] == [(1, 5), (1, 2, 3), (1, 2, 3, 4)]
+    assert cycles[1].skill_ids == ({10}, {20}, {30})
+    assert [cycle.user_ids for cycle in SwapCycleFinder(index).find(1, max_length=2)] == [(1, 5)]
+    assert len(SwapCycleFinder(index, max_cycles=2).find(1)) == 2
+    assert all(6 not in cycle.user_ids for cycle in SwapCycleFinder(index).find(2))
+    assert SwapCycleFinder(index).find(42) == []
+
+def test_cycles_endpoint(client: TestClient, db_session, test_user, login_as):
+    guitar, spanish, cooking = Skill(name="Guitar"), Skill(name="Spanish"), Skill(name="Cooking")
+    bob = User(name="Bob", email="bob@example.com", password_hash="x", is_public=True, availability="available")
+    carol = User(name="Carol", email="carol@example.com", password_hash="x", is_public=True, availability="available")
+    test_user.offered_skills.append(guitar)
+    test_user.wanted_skills.append(cooking)
+    bob.wanted_skills.append(guitar)
+    bob.offered_skills.append(spanish)
+    carol.wanted_skills.append(spanish)
+    carol.offered_skills.append(cooking)
+    db_session.add_all([bob, carol])
+    db_session.commit()
+
+    login_as(client, test_user)
+    response = client.get("/api/matches/cycles")
+    assert response.status_code == 200
+    cycles = response.json()
+    assert len(cycles) == 1
+    assert [user["name"] for user in cycles[0]["users"]] == ["Test User", "Bob", "Carol"]
+    assert cycles[0]["steps"][0] == {"teacher_id": test_user.id, "learner_id": bob.id, "skill_ids": [guitar.id]}
+    assert client.get("/api/matches/cycles", params={"max_length": 2}).json() == []
@@ -0,0 +1,165 @@
+import asyncio
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.core import RateLimitMiddleware, InMemoryRateLimiter, RedisRateLimiter
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def incr(self, key):
+        self.store[key] = int(self.store.get(key, 0)) + 1
+        return self.store[key]
+
+    async def decr(self, key):
+        self.store[key] = int(self.store.get(key, 0)) - 1
+        return self.store[key]
+
+    async def expire(self, key, seconds):
+        self.ttls[key] = seconds
+        return True
+
+    async def get(self, key):
+        value = self.store.get(key)
+        return None if value is None else str(value).encode()
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self.commands.append((name, args))
+            return self
+        return queue
+
+    async def execute(self):
+        return [await getattr(self.client, name)(*args) for name, args in self.commands]
+
+class BrokenRedis:
+    def pipeline(self, transaction=True):
+        raise ConnectionError("redis is down")
+
+def hits(limiter, key, count, limit=3, window=1):
+    return [asyncio.run(limiter.hit(key, limit, window)) for _ in range(count)]
+
+def test_in_memory_limiter_enforces_limit_per_key():
+    limiter = InMemoryRateLimiter(clock=FakeClock())
+    assert hits(limiter, "a", 4) == [True, True, True, False]
+    assert hits(limiter, "b", 1) == [True]
+
+def test_in_memory_limiter_slides_into_next_window():
+    clock = FakeClock(1000.0)
+    limiter = InMemoryRateLimiter(clock=clock)
+    assert hits(limiter, "a", 3) == [True, True, True]
+
+    clock.now = 1001.5
+    assert hits(limiter, "a", 3) == [True, True, False]
+
+    clock.now = 1003.0
+    assert hits(limiter, "a", 3) == [True, True, True]
+
+def test_in_memory_limiter_evicts_idle_clients():
+    clock = FakeClock()
+    limiter = InMemoryRateLimiter(idle_ttl=10, clock=clock)
+    for i in range(100):
+        hits(limiter, f"client-{i}", 1)
+    assert len(limiter.windows[1]) == 100
+
+    clock.now += 11
+    hits(limiter, "fresh", 1)
+    assert list(limiter.windows[1]) == ["fresh"]
+
+def test_in_memory_limiter_keeps_previous_window_past_idle_ttl():
+    clock = FakeClock(961.0)
+    limiter = InMemoryRateLimiter(idle_ttl=60, clock=clock)
+    assert hits(limiter, "a", 3, window=60) == [True, True, True]
+
+    clock.now = 1022.0
+    assert hits(limiter, "a", 2, window=60) == [True, False]
+
+def test_in_memory_limiter_evicts_each_policy_on_its_own_window():
+    clock = FakeClock(60.0)
+    limiter = InMemoryRateLimiter(idle_ttl=60, clock=clock)
+    assert hits(limiter, "/api/auth/login|1.2.3.4", 11, limit=10, window=60)[-1] is False
+
+    clock.now = 120.0
+    assert hits(limiter, "5.6.7.8", 1, limit=5, window=1) == [True]
+    assert hits(limiter, "/api/auth/login|1.2.3.4", 1, limit=10, window=60) == [False]
+
+    clock.now = 200.0
+    hits(limiter, "5.6.7.8", 1, limit=5, window=1)
+    assert "/api/auth/login|1.2.3.4" in limiter.windows[60]
+
+def test_redis_limiter_is_shared_between_workers():
+    client = FakeRedis()
+    clock = FakeClock()
+    worker_a = RedisRateLimiter(client, clock=clock)
+    worker_b = RedisRateLimiter(client, clock=clock)
+
+    assert hits(worker_a, "a", 2) == [True, True]
+    assert hits(worker_b, "a", 2) == [True, False]
+    assert all(ttl == 3 for ttl in client.ttls.values())
+
+def test_redis_limiter_fails_open():
+    limiter = RedisRateLimiter(BrokenRedis(), clock=FakeClock())
+    assert hits(limiter, "a", 5) == [True] * 5
+
+def test_middleware_returns_429_when_limited(monkeypatch):
+    monkeypatch.setattr("app.core.middleware.settings.RATE_LIMIT_REQUESTS", 2)
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware, limiter=InMemoryRateLimiter(clock=FakeClock()))
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    client = TestClient(app)
+    assert [client.get("/ping").status_code for _ in range(3)] == [200, 200, 429]
+
+def test_middleware_applies_per_route_policies(monkeypatch):
+    monkeypatch.setattr("app.core.middleware.settings.RATE_LIMIT_REQUESTS", 3)
+    app = FastAPI()
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=InMemoryRateLimiter(clock=FakeClock()),
+        policies={"/api/auth/login": [1, 60], "/api/skills/search": [5, 1]}
+    )
+
+    @app.get("/api/auth/login")
+    async def login():
+        return {"ok": True}
+
+    @app.get("/api/skills/search")
+    async def search():
+        return {"ok": True}
+
+    @app.get("/api/skills/")
+    async def skills():
+        return {"ok": True}
+
+    client = TestClient(app)
+    responses = [client.get("/api/auth/login") for _ in range(2)]
+    assert [response.status_code for response in responses] == [200, 429]
+    assert responses[1].headers["Retry-After"] == "60"
+    assert [client.get("/api/skills/search").status_code for _ in range(6)] == [200] * 5 + [429]
+    assert [client.get("/api/skills/").status_code for _ in range(4)] == [200] * 3 + [429]
@@ -0,0 +1,53 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.models import SwapRequest, SwapStatus
+
+@pytest.fixture
+def rate(client: TestClient, db_session, login_as):
+    def rate_user(rater, rated, stars):
+        swap = SwapRequest(
+            requester_id=rater.id,
+            responder_id=rated.id,
+            offered_skill_id=rater.offered_skills[0].id,
+            wanted_skill_id=rated.offered_skills[0].id,
+            status=SwapStatus.ACCEPTED
+        )
+        db_session.add(swap)
+        db_session.commit()
+        login_as(client, rater)
+        response = client.post("/api/ratings/", json={"swap_id": swap.id, "rated_id": rated.id, "stars": stars})
+        assert response.status_code == 200
+    return rate_user
+
+def test_rating_updates_user_aggregates(client: TestClient, db_session, add_users_with_skills, query_counter, rate):
+    alice, bob, carol = add_users_with_skills(3)
+    rate(alice, carol, 5)
+    rate(bob, carol, 2)
+
+    query_counter.clear()
+    response = client.get(f"/api/users/{carol.id}")
+    assert response.status_code == 200
+    profile = response.json()
+    assert profile["rating_count"] == 2
+    assert profile["average_rating"] == 3.5
+    assert profile["rating_histogram"] == {"1": 0, "2": 1, "3": 0, "4": 0, "5": 1}
+    assert not any("ratings" in statement for statement in query_counter)
+
+    response = client.get(f"/api/users/{alice.id}")
+    assert response.json()["rating_count"] == 0
+    assert response.json()["average_rating"] is None
+
+def test_search_users_sorted_by_rating(client: TestClient, db_session, add_users_with_skills, rate):
+    alice, bob, carol, dave = add_users_with_skills(4)
+    rate(alice, bob, 3)
+    rate(alice, carol, 5)
+    rate(bob, carol, 4)
+    client.cookies.clear()
+
+    response = client.get("/api/users/", params={"sort": "rating"})
+    assert [user["id"] for user in response.json()] == [carol.id, bob.id, alice.id, dave.id]
+
+    response = client.get("/api/users/", params={"sort": "rating_count"})
+    assert [user["id"] for user in response.json()][:2] == [carol.id, bob.id]
+
+    assert client.get("/api/users/", params={"sort": "bogus"}).status_code == 422
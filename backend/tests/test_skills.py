@@ -0,0 +1,177 @@
+import re
+import pytest
+from fastapi.testclient import TestClient
+from app.models import Skill
+from app.utils import encode_cursor
+
+@pytest.fixture
+def many_skills(db_session):
+    skills = [Skill(name=f"Skill {i:02d}", is_approved=True) for i in range(12)]
+    skills.append(Skill(name="Hidden Skill", is_approved=False))
+    db_session.add_all(skills)
+    db_session.commit()
+    return skills
+
+def test_search_skills_offset_pagination(client: TestClient, many_skills):
+    response = client.get("/api/skills/search?per_page=5&page=3")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 12
+    assert [skill["name"] for skill in data["skills"]] == ["Skill 10", "Skill 11"]
+    assert data["has_more"] is False
+    assert data["next_cursor"] is None
+
+def test_search_skills_cursor_pagination(client: TestClient, many_skills):
+    names = []
+    cursor = None
+    while True:
+        url = "/api/skills/search?per_page=5&count=none"
+        if cursor:
+            url += f"&cursor={cursor}"
+        response = client.get(url)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        names.extend(skill["name"] for skill in data["skills"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+
+    assert names == [f"Skill {i:02d}" for i in range(12)]
+
+def test_search_skills_rejects_malformed_cursor(client: TestClient, many_skills):
+    for values in [(["skill"], 1), ("skill 01", {"x": 1}), ("skill 01", None)]:
+        assert client.get("/api/skills/search", params={"cursor": encode_cursor(*values)}).status_code == 400
+
+def test_postgres_skill_search_uses_indexed_operators():
+    from sqlalchemy.dialects import postgresql
+    from app.api.skills import skill_search_query, skill_search_page
+
+    query, sort_key = skill_search_query("pyth")
+    cursor = encode_cursor(0.5, 7)
+    sql = str(skill_search_page(query, sort_key, "pyth", cursor, 1, 10).compile(dialect=postgresql.dialect()))
+    assert "skills.name %% " in sql or "skills.name % " in sql
+    similarity = r"similarity\(skills\.name, %\(similarity_\d+\)s\)"
+    assert re.search(rf"\({similarity} < %\(\w+\)s OR {similarity} = %\(\w+\)s AND skills\.id > ", sql)
+    assert re.search(rf"ORDER BY {similarity} DESC, skills\.id", sql)
+    assert "OFFSET" not in sql
+
+def test_search_skills_capped_count(client: TestClient, many_skills, monkeypatch):
+    monkeypatch.setattr("app.api.skills.SEARCH_COUNT_CAP", 10)
+    response = client.get("/api/skills/search?count=capped")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 10
+    assert data["total_capped"] is True
+
+def test_skill_catalogue_is_cached_with_etag(client: TestClient, many_skills, query_counter):
+    response = client.get("/api/skills/")
+    assert response.status_code == 200
+    assert [skill["name"] for skill in response.json()] == [f"Skill {i:02d}" for i in range(12)]
+    etag = response.headers["etag"]
+
+    query_counter.clear()
+    response = client.get("/api/skills/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+    assert query_counter == []
+
+    assert client.get("/api/skills/", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+def test_skill_catalogue_invalidated_on_create_and_moderation(client: TestClient, db_session, many_skills, admin_user, login_as):
+    login_as(client, admin_user)
+    etag = client.get("/api/skills/").headers["etag"]
+
+    assert client.post("/api/skills/", json={"name": "brand new skill"}).status_code == 200
+    response = client.get("/api/skills/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert "Brand New Skill" in [skill["name"] for skill in response.json()]
+    etag = response.headers["etag"]
+
+    hidden = next(skill for skill in many_skills if not skill.is_approved)
+    assert client.put(f"/api/admin/skills/{hidden.id}/approve").status_code == 200
+    response = client.get("/api/skills/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert "Hidden Skill" in [skill["name"] for skill in response.json()]
+
+def test_skill_suggester_ranks_prefix_and_fuzzy_matches():
+    from app.core.autocomplete import SkillSuggester
+    suggester = SkillSuggester()
+    suggester.add(1, "Python Programming")
+    suggester.add(2, "Pottery")
+    suggester.add(3, "Web Programming")
+    suggester.add(4, "Piano")
+
+    assert {skill.id for skill in suggester.suggest("pro")[:2]} == {1, 3}
+    assert [skill.id for skill in suggester.suggest("py")][0] == 1
+    assert [skill.id for skill in suggester.suggest("pyhton")][0] == 1
+    assert [skill.id for skill in suggester.suggest("p", limit=2)] == [4, 2]
+
+    suggester.remove(1)
+    assert [skill.id for skill in suggester.suggest("pro")][0] == 3
+    assert 1 not in [skill.id for skill in suggester.suggest("pro")]
+    assert suggester.suggest("!!") == []
+
+def test_suggest_endpoint_tracks_create_and_moderation(client: TestClient, many_skills, admin_user, query_counter, login_as):
+    response = client.get("/api/skills/suggest", params={"q": "skill 1"})
+    assert response.status_code == 200
+    assert [skill["name"] for skill in response.json()][:2] == ["Skill 10", "Skill 11"]
+    assert "Hidden Skill" not in [skill["name"] for skill in client.get("/api/skills/suggest", params={"q": "hid"}).json()]
+
+    query_counter.clear()
+    assert client.get("/api/skills/suggest", params={"q": "ski"}).status_code == 200
+    assert query_counter == []
+
+    login_as(client, admin_user)
+    hidden = next(skill for skill in many_skills if not skill.is_approved)
+    client.put(f"/api/admin/skills/{hidden.id}/approve")
+    client.post("/api/skills/", json={"name": "Watercolour"})
+    assert client.get("/api/skills/suggest", params={"q": "hid"}).json()[0]["name"] == "Hidden Skill"
+    assert client.get("/api/skills/suggest", params={"q": "water"}).json()[0]["name"] == "Watercolour"
+
+    client.put(f"/api/admin/skills/{hidden.id}/reject")
+    assert client.get("/api/skills/suggest", params={"q": "hid"}).json() == []
+
+def test_create_skill_is_idempotent_across_case(client: TestClient, test_user, query_counter, login_as):
+    login_as(client, test_user)
+
+    first = client.post("/api/skills/", json={"name": "rock climbing"})
+    assert first.status_code == 200
+    assert first.json()["name"] == "Rock Climbing"
+
+    query_counter.clear()
+    second = client.post("/api/skills/", json={"name": "ROCK CLIMBING", "description": "ignored"})
+    assert second.status_code == 200
+    assert second.json()["id"] == first.json()["id"]
+    inserts = [statement for statement in query_counter if statement.startswith("INSERT INTO skills")]
+    assert len(inserts) == 1
+    assert "ON CONFLICT DO NOTHING RETURNING" in inserts[0]
+
+def test_create_skill_returns_existing_when_sql_lower_differs(client: TestClient, db_session, test_user, login_as):
+    existing = Skill(name="Éclair Baking", is_approved=True)
+    db_session.add(existing)
+    db_session.commit()
+    login_as(client, test_user)
+
+    response = client.post("/api/skills/", json={"name": "éclair baking"})
+    assert response.status_code == 200
+    assert response.json()["id"] == existing.id
+
+def test_bulk_create_skills(client: TestClient, test_user, many_skills, login_as):
+    login_as(client, test_user)
+
+    response = client.post("/api/skills/bulk", json={"skills": [
+        {"name": "knitting"},
+        {"name": "skill 03"},
+        {"name": "Knitting", "description": "duplicate in request"},
+        {"name": "welding", "description": "Metal work"}
+    ]})
+    assert response.status_code == 200
+    data = response.json()
+    assert [skill["name"] for skill in data["created"]] == ["Knitting", "Welding"]
+    assert data["created"][1]["description"] == "Metal work"
+    assert [skill["name"] for skill in data["existing"]] == ["Skill 03"]
+    assert "Welding" in [skill["name"] for skill in client.get("/api/skills/").json()]
+
+    assert client.post("/api/skills/bulk", json={"skills": []}).status_code == 422
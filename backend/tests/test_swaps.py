@@ -0,0 +1,163 @@
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+from app.models import User, Skill, SwapRequest, SwapStatus, Rating
+from app.core import FastJSONResponse
+from app.utils import encode_cursor
+from app.schemas import SkillBase, SwapRequestResponse
+
+def login_as(client: TestClient, user: User, login_as):
+    login_as(client, user)
+
+@pytest.fixture
+def swap_partner(db_session, test_user, test_skill):
+    partner = User(
+        name="Swap Partner",
+        email="partner@example.com",
+        password_hash="not-used",
+        is_public=True,
+        availability="available"
+    )
+    partner_skill = Skill(name="Partner Skill", is_approved=True)
+    partner.offered_skills.append(partner_skill)
+    test_user.offered_skills.append(test_skill)
+    db_session.add(partner)
+    db_session.commit()
+    db_session.refresh(partner)
+    return partner, partner_skill
+
+def add_swaps(db_session, requester, responder, offered_skill, wanted_skill, count, statuses=None):
+    statuses = statuses or [SwapStatus.PENDING, SwapStatus.COMPLETED]
+    start = datetime(2024, 1, 1)
+    for i in range(count):
+        status = statuses[i % len(statuses)]
+        swap = SwapRequest(
+            requester_id=requester.id,
+            responder_id=responder.id,
+            offered_skill_id=offered_skill.id,
+            wanted_skill_id=wanted_skill.id,
+            status=status,
+            created_at=start + timedelta(minutes=i // 3)
+        )
+        if status == SwapStatus.COMPLETED:
+            swap.rating = Rating(rater_id=requester.id, rated_id=responder.id, stars=5)
+        db_session.add(swap)
+    db_session.commit()
+
+def test_my_swaps_query_count_is_constant(client: TestClient, db_session, test_user, test_skill, swap_partner, query_counter, login_as):
+    partner, partner_skill = swap_partner
+    login_as(client, test_user)
+
+    add_swaps(db_session, test_user, partner, test_skill, partner_skill, 1)
+    client.get("/api/swaps/my")
+    query_counter.clear()
+    response = client.get("/api/swaps/my")
+    assert response.status_code == 200
+    single_swap_queries = len(query_counter)
+
+    add_swaps(db_session, test_user, partner, test_skill, partner_skill, 9)
+    query_counter.clear()
+    response = client.get("/api/swaps/my")
+    assert response.status_code == 200
+    data = response.json()
+
+    assert len(query_counter) == single_swap_queries
+    assert len(data["pending"]) == 6
+    assert len(data["completed"]) == 4
+    assert all(swap["has_rating"] for swap in data["completed"])
+    assert not any(swap["has_rating"] for swap in data["pending"])
+
+def test_create_and_accept_swap_request(client: TestClient, test_user, test_skill, swap_partner, login_as):
+    partner, partner_skill = swap_partner
+    login_as(client, test_user)
+
+    response = client.post(
+        "/api/swaps/",
+        json={
+            "responder_id": partner.id,
+            "offered_skill_id": test_skill.id,
+            "wanted_skill_id": partner_skill.id
+        }
+    )
+    assert response.status_code == 200
+    swap = response.json()
+    assert swap["requester_name"] == test_user.name
+    assert swap["responder_name"] == partner.name
+    assert swap["wanted_skill"]["name"] == partner_skill.name
+    assert swap["has_rating"] is False
+
+    login_as(client, partner)
+    response = client.put(f"/api/swaps/{swap['id']}", json={"status": "accepted"})
+    assert response.status_code == 200
+    assert response.json()["status"] == "accepted"
+
+def test_my_swaps_cursor_pagination(client: TestClient, db_session, test_user, test_skill, swap_partner, login_as):
+    partner, partner_skill = swap_partner
+    add_swaps(db_session, test_user, partner, test_skill, partner_skill, 7, [SwapStatus.PENDING])
+    add_swaps(db_session, partner, test_user, partner_skill, test_skill, 3, [SwapStatus.REJECTED, SwapStatus.CANCELLED])
+    login_as(client, test_user)
+
+    response = client.get("/api/swaps/my?limit=2")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["counts"] == {"pending": 7, "accepted": 0, "completed": 0, "history": 3}
+    assert len(data["pending"]) == 2
+    assert len(data["history"]) == 2
+    assert data["next_cursors"]["accepted"] is None
+
+    seen = []
+    cursor = None
+    while True:
+        url = "/api/swaps/my?status=pending&limit=3"
+        if cursor:
+            url += f"&cursor={cursor}"
+        response = client.get(url)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["history"] == []
+        seen.extend(swap["id"] for swap in data["pending"])
+        cursor = data["next_cursors"]["pending"]
+        if not cursor:
+            break
+
+    assert len(seen) == len(set(seen)) == 7
+    created = [(swap.created_at, swap.id) for swap in db_session.query(SwapRequest).filter(SwapRequest.status == SwapStatus.PENDING)]
+    assert seen == [swap_id for _, swap_id in sorted(created, reverse=True)]
+
+def test_my_swaps_rejects_bad_cursor(client: TestClient, test_user, login_as):
+    login_as(client, test_user)
+    assert client.get("/api/swaps/my?cursor=abc").status_code == 400
+    assert client.get("/api/swaps/my?status=pending&cursor=not-a-cursor").status_code == 400
+    for values in [("2024-01-01", [1]), ({"x": 1}, 1), (5, 1), ("2024-01-01", True), ("2024-01-01", 1e999)]:
+        response = client.get("/api/swaps/my", params={"status": "pending", "cursor": encode_cursor(*values)})
+        assert response.status_code == 400
+
+def test_my_swaps_fast_json_matches_default_encoding(client: TestClient, db_session, test_user, test_skill, swap_partner, monkeypatch, login_as):
+    partner, partner_skill = swap_partner
+    add_swaps(db_session, test_user, partner, test_skill, partner_skill, 4)
+    login_as(client, test_user)
+
+    monkeypatch.setattr("app.core.responses.settings.FAST_JSON_RESPONSES", True)
+    fast = client.get("/api/swaps/my")
+    monkeypatch.setattr("app.core.responses.settings.FAST_JSON_RESPONSES", False)
+    default = client.get("/api/swaps/my")
+
+    assert fast.status_code == default.status_code == 200
+    assert fast.json() == default.json()
+    assert fast.json()["pending"][0]["status"] == "pending"
+
+def test_fast_json_response_encodes_like_jsonable_encoder():
+    swap = SwapRequestResponse(
+        id=1,
+        requester_id=1,
+        responder_id=2,
+        requester_name="Alice",
+        responder_name="Bob",
+        offered_skill=SkillBase(id=3, name="Guitar"),
+        wanted_skill=SkillBase(id=4, name="Piano"),
+        status=SwapStatus.ACCEPTED,
+        created_at=datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    )
+    assert json.loads(FastJSONResponse([swap]).body) == jsonable_encoder([swap])
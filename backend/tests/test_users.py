@@ -29,4 +29,118 @@ def test_get_user_profile_public(client: TestClient, test_user):
 
 def test_get_user_profile_not_found(client: TestClient):
     response = client.get("/api/users/99999")
-    assert response.status_code == 404
\ No newline at end of file
+    assert response.status_code == 404
+
+def test_search_users_matches_name_bio_and_offered_skills(client: TestClient, db_session, test_user, test_skill):
+    test_user.bio = "Weekend baker"
+    test_user.offered_skills.append(test_skill)
+    db_session.commit()
+
+    for term in ["test user", "BAKER", "test skill"]:
+        response = client.get(f"/api/users/?q={term}")
+        assert response.status_code == 200
+        assert [user["id"] for user in response.json()] == [test_user.id]
+
+    response = client.get("/api/users/?q=nobody")
+    assert response.status_code == 200
+    assert response.json() == []
+
+def test_postgres_user_search_uses_indexed_operators():
+    from sqlalchemy import select
+    from sqlalchemy.dialects import postgresql
+    from app.models import User
+    from app.utils import PostgresUserSearch
+
+    query, rank = PostgresUserSearch().search(select(User), "pyth dev")
+    sql = str(query.order_by(rank.desc()).compile(dialect=postgresql.dialect()))
+    assert "users.search_vector @@ to_tsquery" in sql
+    assert "users.name %% " in sql or "users.name % " in sql
+    assert "ts_rank(users.search_vector" in sql
+
+def test_search_users_query_count_is_constant(client: TestClient, add_users_with_skills, query_counter):
+    add_users_with_skills(1)
+    response = client.get("/api/users/?per_page=20")
+    assert response.status_code == 200
+    single_user_queries = len(query_counter)
+
+    add_users_with_skills(6)
+    query_counter.clear()
+    response = client.get("/api/users/?per_page=20")
+    assert response.status_code == 200
+    users = response.json()
+
+    assert len(users) == 7
+    assert all(len(user["offered_skills"]) == 2 and len(user["wanted_skills"]) == 2 for user in users)
+    assert len(query_counter) == single_user_queries
+
+def test_get_user_profile_query_count_is_constant(client: TestClient, add_users_with_skills, query_counter):
+    few, = add_users_with_skills(1, skills_per_user=1)
+    many, = add_users_with_skills(1, skills_per_user=8)
+
+    response = client.get(f"/api/users/{few.id}")
+    assert response.status_code == 200
+    few_skill_queries = len(query_counter)
+
+    query_counter.clear()
+    response = client.get(f"/api/users/{many.id}")
+    assert response.status_code == 200
+    assert len(response.json()["wanted_skills"]) == 8
+    assert len(query_counter) == few_skill_queries
+
+def test_authenticated_user_is_cached_between_requests(client: TestClient, test_user, query_counter, login_as):
+    login_as(client, test_user)
+
+    assert client.get("/api/skills/").status_code == 200
+    assert any("FROM users" in statement for statement in query_counter)
+
+    query_counter.clear()
+    assert client.get("/api/skills/").status_code == 200
+    assert not any("FROM users" in statement for statement in query_counter)
+
+def test_profile_update_through_cached_user(client: TestClient, test_user, login_as):
+    login_as(client, test_user)
+
+    assert client.get("/api/users/me").json()["bio"] is None
+    response = client.put("/api/users/me", json={"bio": "Cached but current"})
+    assert response.status_code == 200
+    assert client.get("/api/users/me").json()["bio"] == "Cached but current"
+
+def test_profile_skill_update_is_constant_query(client: TestClient, db_session, test_user, query_counter, login_as):
+    from app.models import Skill
+    login_as(client, test_user)
+    skills = [Skill(name=f"Bulk Skill {i}") for i in range(12)]
+    db_session.add_all(skills)
+    db_session.commit()
+    ids = [skill.id for skill in skills]
+
+    client.put("/api/users/me", json={"offered_skill_ids": ids[:2], "wanted_skill_ids": ids[2:4]})
+    query_counter.clear()
+    response = client.put("/api/users/me", json={"offered_skill_ids": ids[1:3], "wanted_skill_ids": ids[3:5]})
+    assert response.status_code == 200
+    small_update_queries = len(query_counter)
+
+    query_counter.clear()
+    response = client.put("/api/users/me", json={"offered_skill_ids": ids[2:10], "wanted_skill_ids": ids[5:12]})
+    assert response.status_code == 200
+    assert len(query_counter) == small_update_queries
+    assert sorted(skill["id"] for skill in response.json()["offered_skills"]) == ids[2:10]
+    assert sorted(skill["id"] for skill in response.json()["wanted_skills"]) == ids[5:12]
+
+def test_profile_update_rejects_invalid_skill_ids(client: TestClient, test_user, test_skill, login_as):
+    login_as(client, test_user)
+
+    response = client.put("/api/users/me", json={"offered_skill_ids": [test_skill.id, 9998], "wanted_skill_ids": [9999]})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid skill ids: 9998, 9999"
+    assert client.get("/api/users/me").json()["offered_skills"] == []
+
+def test_search_users_fast_json_matches_default_encoding(client: TestClient, add_users_with_skills, monkeypatch):
+    add_users_with_skills(3)
+    monkeypatch.setattr("app.core.responses.settings.FAST_JSON_RESPONSES", True)
+    fast = client.get("/api/users/?per_page=20")
+    monkeypatch.setattr("app.core.responses.settings.FAST_JSON_RESPONSES", False)
+    default = client.get("/api/users/?per_page=20")
+
+    assert fast.status_code == default.status_code == 200
+    assert fast.json() == default.json()
+    assert len(fast.json()) == 3
@@ -22,6 +22,8 @@ import Card, { CardHeader, CardTitle, CardContent } from '@/components/ui/Card';
 import Button from '@/components/ui/Button';
 import Badge from '@/components/ui/Badge';
 
+type AdminList = 'users' | 'skills' | 'swaps';
+
 export default function AdminPage() {
   const { user, isAuthenticated, isLoading } = useAuth();
   const router = useRouter();
@@ -30,6 +32,11 @@ export default function AdminPage() {
   const [users, setUsers] = useState<any[]>([]);
   const [skills, setSkills] = useState<any[]>([]);
   const [swaps, setSwaps] = useState<any[]>([]);
+  const [cursors, setCursors] = useState<Record<AdminList, string | null>>({
+    users: null,
+    skills: null,
+    swaps: null
+  });
   const [loadingStates, setLoadingStates] = useState<Record<string, boolean>>({});
 
   useEffect(() => {
@@ -52,14 +59,53 @@ export default function AdminPage() {
         adminAPI.getAllSwaps()
       ]);
       
-      setUsers(usersData);
-      setSkills(skillsData);
-      setSwaps(swapsData);
+      setUsers(usersData.items);
+      setSkills(skillsData.items);
+      setSwaps(swapsData.items);
+      setCursors({
+        users: usersData.next_cursor,
+        skills: skillsData.next_cursor,
+        swaps: swapsData.next_cursor
+      });
     } catch (error: any) {
       showError('Failed to load admin data', error.message);
     }
   };
 
+  const loadMore = async (list: AdminList) => {
+    const cursor = cursors[list];
+    if (!cursor) return;
+
+    setLoading(`more-${list}`, true);
+    try {
+      if (list === 'users') {
+        const page = await adminAPI.getAllUsers({ cursor });
+        setUsers(prev => [...prev, ...page.items]);
+        setCursors(prev => ({ ...prev, users: page.next_cursor }));
+      } else if (list === 'skills') {
+        const page = await adminAPI.getAllSkills({ cursor });
+        setSkills(prev => [...prev, ...page.items]);
+        setCursors(prev => ({ ...prev, skills: page.next_cursor }));
+      } else {
+        const page = await adminAPI.getAllSwaps({ cursor });
+        setSwaps(prev => [...prev, ...page.items]);
+        setCursors(prev => ({ ...prev, swaps: page.next_cursor }));
+      }
+    } catch (error: any) {
+      showError('Failed to load admin data', error.message);
+    } finally {
+      setLoading(`more-${list}`, false);
+    }
+  };
+
+  const updateUser = (userId: number, changes: Record<string, any>) => {
+    setUsers(prev => prev.map(item => item.id === userId ? { ...item, ...changes } : item));
+  };
+
+  const updateSkill = (skillId: number, changes: Record<string, any>) => {
+    setSkills(prev => prev.map(item => item.id === skillId ? { ...item, ...changes } : item));
+  };
+
   const setLoading = (key: string, loading: boolean) => {
     setLoadingStates(prev => ({ ...prev, [key]: loading }));
   };
@@ -71,7 +117,7 @@ export default function AdminPage() {
     try {
       await adminAPI.banUser(userId);
       showSuccess('User banned successfully');
-      loadData();
+      updateUser(userId, { is_banned: true });
     } catch (error: any) {
       showError('Failed to ban user', error.message);
     } finally {
@@ -84,7 +130,7 @@ export default function AdminPage() {
     try {
       await adminAPI.unbanUser(userId);
       showSuccess('User unbanned successfully');
-      loadData();
+      updateUser(userId, { is_banned: false });
     } catch (error: any) {
       showError('Failed to unban user', error.message);
     } finally {
@@ -97,7 +143,7 @@ export default function AdminPage() {
     try {
       await adminAPI.approveSkill(skillId);
       showSuccess(`Skill "${skillName}" approved`);
-      loadData();
+      updateSkill(skillId, { is_approved: true });
     } catch (error: any) {
       showError('Failed to approve skill', error.message);
     } finally {
@@ -112,7 +158,7 @@ export default function AdminPage() {
     try {
       await adminAPI.rejectSkill(skillId);
       showSuccess(`Skill "${skillName}" rejected`);
-      loadData();
+      updateSkill(skillId, { is_approved: false });
     } catch (error: any) {
       showError('Failed to reject skill', error.message);
     } finally {
@@ -264,7 +310,7 @@ export default function AdminPage() {
                                   {userData.name}
                                 </div>
                                 <div className="text-sm text-gray-500">
-                                  {userData.offered_skills?.length || 0} skills offered
+                                  {userData.offered_skill_count} skills offered
                                 </div>
                               </div>
                             </div>
@@ -317,6 +363,18 @@ export default function AdminPage() {
                     </tbody>
                   </table>
                 </div>
+                {cursors.users && (
+                  <div className="mt-4 flex justify-center">
+                    <Button
+                      onClick={() => loadMore('users')}
+                      loading={loadingStates['more-users']}
+                      variant="outline"
+                      size="sm"
+                    >
+                      Load more
+                    </Button>
+                  </div>
+                )}
               </CardContent>
             </Card>
           </TabsContent>
@@ -394,6 +452,18 @@ export default function AdminPage() {
                     </tbody>
                   </table>
                 </div>
+                {cursors.skills && (
+                  <div className="mt-4 flex justify-center">
+                    <Button
+                      onClick={() => loadMore('skills')}
+                      loading={loadingStates['more-skills']}
+                      variant="outline"
+                      size="sm"
+                    >
+                      Load more
+                    </Button>
+                  </div>
+                )}
               </CardContent>
             </Card>
           </TabsContent>
@@ -457,6 +527,18 @@ export default function AdminPage() {
                     </tbody>
                   </table>
                 </div>
+                {cursors.swaps && (
+                  <div className="mt-4 flex justify-center">
+                    <Button
+                      onClick={() => loadMore('swaps')}
+                      loading={loadingStates['more-swaps']}
+                      variant="outline"
+                      size="sm"
+                    >
+                      Load more
+                    </Button>
+                  </div>
+                )}
               </CardContent>
             </Card>
           </TabsContent>
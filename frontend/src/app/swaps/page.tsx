@@ -1,20 +1,34 @@
 'use client';
 
-import React, { useEffect } from 'react';
+import React, { useEffect, useState } from 'react';
 import { useRouter } from 'next/navigation';
 import { MessageSquare, Clock, CheckCircle, Star } from 'lucide-react';
 import { useAuth } from '@/hooks/useAuth';
 import { useMySwaps } from '@/hooks/useApi';
+import { swapAPI } from '@/lib/api';
+import { SwapRequest } from '@/types/swap';
 import SwapCard from '@/components/swap/SwapCard';
 import Tabs, { TabsList, TabsTrigger, TabsContent } from '@/components/ui/Tabs';
 import Card, { CardContent } from '@/components/ui/Card';
 import Button from '@/components/ui/Button';
 import Link from 'next/link';
 
+type SwapBucket = 'pending' | 'accepted' | 'completed' | 'history';
+
+const EMPTY_PAGES: Record<SwapBucket, SwapRequest[]> = {
+  pending: [],
+  accepted: [],
+  completed: [],
+  history: []
+};
+
 export default function SwapsPage() {
   const { isAuthenticated, isLoading } = useAuth();
   const router = useRouter();
   const { data: swaps, error, isLoading: swapsLoading, mutate } = useMySwaps();
+  const [olderSwaps, setOlderSwaps] = useState<Record<SwapBucket, SwapRequest[]>>(EMPTY_PAGES);
+  const [cursors, setCursors] = useState<Partial<Record<SwapBucket, string | null>>>({});
+  const [loadingBucket, setLoadingBucket] = useState<SwapBucket | null>(null);
 
   useEffect(() => {
     if (!isLoading && !isAuthenticated) {
@@ -23,9 +37,35 @@ export default function SwapsPage() {
   }, [isAuthenticated, isLoading, router]);
 
   const handleSwapUpdate = () => {
+    setOlderSwaps(EMPTY_PAGES);
+    setCursors({});
     mutate();
   };
 
+  const bucketSwaps = (bucket: SwapBucket) => {
+    const firstPage = swaps?.[bucket] || [];
+    const seen = new Set(firstPage.map((swap) => swap.id));
+    return [...firstPage, ...olderSwaps[bucket].filter((swap) => !seen.has(swap.id))];
+  };
+
+  const nextCursor = (bucket: SwapBucket) => {
+    return bucket in cursors ? cursors[bucket] : swaps?.next_cursors[bucket];
+  };
+
+  const loadMore = async (bucket: SwapBucket) => {
+    const cursor = nextCursor(bucket);
+    if (!cursor) return;
+
+    setLoadingBucket(bucket);
+    try {
+      const page = await swapAPI.getMySwaps({ status: bucket, cursor });
+      setOlderSwaps(prev => ({ ...prev, [bucket]: [...prev[bucket], ...page[bucket]] }));
+      setCursors(prev => ({ ...prev, [bucket]: page.next_cursors[bucket] ?? null }));
+    } finally {
+      setLoadingBucket(null);
+    }
+  };
+
   if (isLoading || swapsLoading) {
     return (
       <div className="min-h-screen flex items-center justify-center">
@@ -93,6 +133,20 @@ export default function SwapsPage() {
     </Card>
   );
 
+  const LoadMore = ({ bucket }: { bucket: SwapBucket }) => (
+    nextCursor(bucket) ? (
+      <div className="mt-6 flex justify-center">
+        <Button
+          onClick={() => loadMore(bucket)}
+          loading={loadingBucket === bucket}
+          variant="outline"
+        >
+          Load more
+        </Button>
+      </div>
+    ) : null
+  );
+
   return (
     <div className="min-h-screen bg-gray-50 py-8">
       <div className="max-w-6xl mx-auto px-4 sm:px-6 lg:px-8">
@@ -109,24 +163,24 @@ export default function SwapsPage() {
           <TabsList className="grid w-full grid-cols-4 mb-8">
             <TabsTrigger value="pending" className="flex items-center space-x-2">
               <Clock className="w-4 h-4" />
-              <span>Pending ({swaps?.pending.length || 0})</span>
+              <span>Pending ({swaps?.counts.pending ?? 0})</span>
             </TabsTrigger>
             <TabsTrigger value="accepted" className="flex items-center space-x-2">
               <CheckCircle className="w-4 h-4" />
-              <span>Accepted ({swaps?.accepted.length || 0})</span>
+              <span>Accepted ({swaps?.counts.accepted ?? 0})</span>
             </TabsTrigger>
             <TabsTrigger value="completed" className="flex items-center space-x-2">
               <Star className="w-4 h-4" />
-              <span>Completed ({swaps?.completed.length || 0})</span>
+              <span>Completed ({swaps?.counts.completed ?? 0})</span>
             </TabsTrigger>
             <TabsTrigger value="history" className="flex items-center space-x-2">
               <MessageSquare className="w-4 h-4" />
-              <span>History ({swaps?.history.length || 0})</span>
+              <span>History ({swaps?.counts.history ?? 0})</span>
             </TabsTrigger>
           </TabsList>
 
           <TabsContent value="pending">
-            {swaps?.pending.length === 0 ? (
+            {bucketSwaps('pending').length === 0 ? (
               <EmptyState
                 icon={Clock}
                 title="No Pending Requests"
@@ -136,7 +190,7 @@ export default function SwapsPage() {
               />
             ) : (
               <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
-                {swaps?.pending.map((swap) => (
+                {bucketSwaps('pending').map((swap) => (
                   <SwapCard
                     key={swap.id}
                     swap={swap}
@@ -145,10 +199,11 @@ export default function SwapsPage() {
                 ))}
               </div>
             )}
+            <LoadMore bucket="pending" />
           </TabsContent>
 
           <TabsContent value="accepted">
-            {swaps?.accepted.length === 0 ? (
+            {bucketSwaps('accepted').length === 0 ? (
               <EmptyState
                 icon={CheckCircle}
                 title="No Accepted Swaps"
@@ -156,7 +211,7 @@ export default function SwapsPage() {
               />
             ) : (
               <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
-                {swaps?.accepted.map((swap) => (
+                {bucketSwaps('accepted').map((swap) => (
                   <SwapCard
                     key={swap.id}
                     swap={swap}
@@ -165,10 +220,11 @@ export default function SwapsPage() {
                 ))}
               </div>
             )}
+            <LoadMore bucket="accepted" />
           </TabsContent>
 
           <TabsContent value="completed">
-            {swaps?.completed.length === 0 ? (
+            {bucketSwaps('completed').length === 0 ? (
               <EmptyState
                 icon={Star}
                 title="No Completed Swaps"
@@ -176,7 +232,7 @@ export default function SwapsPage() {
               />
             ) : (
               <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
-                {swaps?.completed.map((swap) => (
+                {bucketSwaps('completed').map((swap) => (
                   <SwapCard
                     key={swap.id}
                     swap={swap}
@@ -185,10 +241,11 @@ export default function SwapsPage() {
                 ))}
               </div>
             )}
+            <LoadMore bucket="completed" />
           </TabsContent>
 
           <TabsContent value="history">
-            {swaps?.history.length === 0 ? (
+            {bucketSwaps('history').length === 0 ? (
               <EmptyState
                 icon={MessageSquare}
                 title="No History"
@@ -196,7 +253,7 @@ export default function SwapsPage() {
               />
             ) : (
               <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
-                {swaps?.history.map((swap) => (
+                {bucketSwaps('history').map((swap) => (
                   <SwapCard
                     key={swap.id}
                     swap={swap}
@@ -205,6 +262,7 @@ export default function SwapsPage() {
                 ))}
               </div>
             )}
+            <LoadMore bucket="history" />
           </TabsContent>
         </Tabs>
       </div>
@@ -70,7 +70,7 @@ export const useSkills = (params?: {
 export const useMySwaps = () => {
   return useSWR(
     '/swaps/my',
-    swapAPI.getMySwaps,
+    () => swapAPI.getMySwaps(),
     {
       revalidateOnFocus: true,
       errorRetryCount: 2,
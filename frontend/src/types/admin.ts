@@ -0,0 +1,55 @@
+import { Skill } from './skill';
+import { SwapStatus } from './swap';
+
+export interface AdminUser {
+  id: number;
+  name: string;
+  email: string;
+  avatar_url?: string;
+  is_public: boolean;
+  is_banned: boolean;
+  is_admin: boolean;
+  availability: string;
+  created_at: string;
+  offered_skill_count: number;
+}
+
+export interface AdminSwap {
+  id: number;
+  requester_id: number;
+  requester_name: string;
+  responder_id: number;
+  responder_name: string;
+  offered_skill: string;
+  wanted_skill: string;
+  status: SwapStatus;
+  created_at: string;
+}
+
+export interface AdminPage<T> {
+  items: T[];
+  next_cursor: string | null;
+}
+
+export interface AdminListParams {
+  cursor?: string;
+  limit?: number;
+  created_after?: string;
+  created_before?: string;
+}
+
+export interface AdminUserParams extends AdminListParams {
+  banned?: boolean;
+}
+
+export interface AdminSkillParams extends AdminListParams {
+  approved?: boolean;
+}
+
+export interface AdminSwapParams extends AdminListParams {
+  status?: SwapStatus;
+}
+
+export type AdminUserPage = AdminPage<AdminUser>;
+export type AdminSkillPage = AdminPage<Skill>;
+export type AdminSwapPage = AdminPage<AdminSwap>;
@@ -25,16 +25,29 @@ export interface Skill {
   
   export interface SkillSearchResult {
     skills: SkillBase[];
-    total: number;
+    total: number | null;
+    total_capped: boolean;
     page: number;
     per_page: number;
     has_more: boolean;
+    next_cursor: string | null;
   }
   
   export interface SkillSearchParams {
     q?: string;
     page?: number;
     per_page?: number;
+    cursor?: string;
+    count?: 'exact' | 'capped' | 'none';
+  }
+  
+  export interface SkillBulkCreate {
+    skills: SkillCreate[];
+  }
+  
+  export interface SkillBulkCreateResult {
+    created: SkillBase[];
+    existing: SkillBase[];
   }
   
   export interface SkillStats {
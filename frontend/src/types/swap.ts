@@ -32,6 +32,8 @@ export interface MySwaps {
   accepted: SwapRequest[];
   completed: SwapRequest[];
   history: SwapRequest[];
+  counts: Record<'pending' | 'accepted' | 'completed' | 'history', number>;
+  next_cursors: Partial<Record<'pending' | 'accepted' | 'completed' | 'history', string | null>>;
 }
 
 export interface Rating {
@@ -21,6 +21,9 @@ export interface UserPublic {
   availability: string;
   offered_skills: Skill[];
   wanted_skills: Skill[];
+  rating_count: number;
+  average_rating: number | null;
+  rating_histogram: Record<1 | 2 | 3 | 4 | 5, number>;
 }
 
 export interface UserProfile extends User {}
@@ -51,4 +54,22 @@ export interface Skill {
   id: number;
   name: string;
   description?: string;
-}
\ No newline at end of file
+}
+
+export interface SwapMatch {
+  user: UserSearch;
+  offered_skill_ids: number[];
+  wanted_skill_ids: number[];
+  overlap: number;
+}
+
+export interface SwapCycleStep {
+  teacher_id: number;
+  learner_id: number;
+  skill_ids: number[];
+}
+
+export interface SwapCycle {
+  users: UserSearch[];
+  steps: SwapCycleStep[];
+}